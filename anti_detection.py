@@ -1,82 +1,208 @@
-import time
+import logging
+import math
 import random
-from selenium.webdriver.common.action_chains import ActionChains
+import threading
+from selenium.webdriver.common.actions.action_builder import ActionBuilder
+from selenium.webdriver.common.keys import Keys
+from selenium.common.exceptions import MoveTargetOutOfBoundsException, WebDriverException
+
+logger = logging.getLogger(__name__)
+
+# Process-wide RNG (seeded from OS entropy at import) for all human timing
+_rng = random.Random()
+
+# Set on server shutdown so in-flight human delays return immediately
+_stop_event = threading.Event()
+
+def _sleep(seconds):
+    """
+    Cooperative sleep used by all human-behaviour helpers
+    
+    Behaves like time.sleep() but wakes up early once stop_delays()
+    has been called, so worker threads don't hold up shutdown.
+    """
+    _stop_event.wait(seconds)
+
+def stop_delays():
+    """Interrupt all current and future human delays (call on shutdown)"""
+    _stop_event.set()
+
+# Per-thread HumanRhythm currently in effect (see HumanRhythm)
+_local = threading.local()
+
+class HumanRhythm:
+    """
+    Delay budget shared by every human_delay() in one request
+    
+    Use as a context manager around a whole bot action. While active,
+    human_delay() draws log-normal pauses (closer to real human timing than
+    uniform ones) around the middle of its range, capped by what is left of
+    the budget - so the total time spent waiting is bounded and predictable.
+    """
+    
+    def __init__(self, total_budget, sigma=0.35):
+        """
+        Args:
+            total_budget: Maximum total seconds to spend in human_delay()
+            sigma: Spread of the log-normal distribution
+        """
+        self.remaining = total_budget
+        self.sigma = sigma
+        self._previous = None
+    
+    def draw(self, min_seconds, max_seconds):
+        """Draw the next delay and charge it to the budget"""
+        median = (min_seconds + max_seconds) / 2
+        if median <= 0 or self.remaining <= 0:
+            return 0
+        
+        delay = min(_rng.lognormvariate(math.log(median), self.sigma), self.remaining)
+        self.remaining -= delay
+        return delay
+    
+    def __enter__(self):
+        self._previous = getattr(_local, 'rhythm', None)
+        _local.rhythm = self
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        _local.rhythm = self._previous
+        return False
 
 def human_delay(min_seconds=2, max_seconds=5):
     """
     Add random delay to mimic human behavior
     
+    Inside an active HumanRhythm the delay is drawn from its budget.
+    
     Args:
         min_seconds: Minimum delay in seconds
         max_seconds: Maximum delay in seconds
     """
-    delay = random.uniform(min_seconds, max_seconds)
-    print(f"⏱️  Waiting {delay:.2f} seconds...")
-    time.sleep(delay)
+    rhythm = getattr(_local, 'rhythm', None)
+    if rhythm is not None:
+        delay = rhythm.draw(min_seconds, max_seconds)
+    else:
+        delay = _rng.uniform(min_seconds, max_seconds)
+    logger.info(f"⏱️  Waiting {delay:.2f} seconds...")
+    _sleep(delay)
+
+def retry_with_backoff(action, exceptions, tries=3, base_delay=0.25):
+    """
+    Call action(), retrying with exponential backoff on transient errors
+    
+    No delay is added when the first attempt succeeds.
+    
+    Args:
+        action: Callable to run
+        exceptions: Exception type(s) worth retrying
+        tries: Maximum number of attempts
+        base_delay: Delay before the first retry (doubles each time)
+    
+    Returns:
+        Whatever action() returns
+    """
+    for attempt in range(tries):
+        try:
+            return action()
+        except exceptions:
+            if attempt == tries - 1:
+                raise
+            _sleep(base_delay * 2 ** attempt + _rng.random() * 0.1)
 
 def human_type(element, text, min_delay=0.05, max_delay=0.2):
     """
     Type text character by character with random delays
     Mimics human typing speed
     
+    Every keystroke and the pause after it go to chromedriver as one W3C
+    Actions sequence, so the browser still gets real key events with human
+    timing but typing costs a single WebDriver round-trip.
+    
     Args:
         element: Selenium WebElement to type into
         text: Text to type
         min_delay: Minimum delay between keystrokes (seconds)
         max_delay: Maximum delay between keystrokes (seconds)
     """
-    print(f"⌨️  Typing: {text[:50]}{'...' if len(text) > 50 else ''}")
+    logger.info(f"⌨️  Typing: {text[:50]}{'...' if len(text) > 50 else ''}")
+    driver = element.parent
+    driver.execute_script("arguments[0].focus();", element)
+    
+    builder = ActionBuilder(driver)
+    keyboard = builder.key_action
     for char in text:
-        element.send_keys(char)
-        time.sleep(random.uniform(min_delay, max_delay))
+        key = Keys.ENTER if char == '\n' else char
+        keyboard.key_down(key).key_up(key)
+        keyboard.pause(_rng.uniform(min_delay, max_delay))
+    builder.perform()
 
 def random_mouse_movement(driver, element):
     """
     Move mouse to element with random path
     Makes automation look more human
     
+    The curved path is sent as a single W3C Actions request made of several
+    short pointer moves, ending on the element's center.
+    
     Args:
         driver: Selenium WebDriver instance
         element: Target element to move to
     """
     try:
-        actions = ActionChains(driver)
-        # Move to a random offset first
-        actions.move_by_offset(
-            random.randint(-100, 100),
-            random.randint(-100, 100)
-        )
-        # Then move to the actual element
-        actions.move_to_element(element)
-        actions.perform()
+        # Quadratic Bezier from a random offset to the element center
+        # (offsets are relative to the center)
+        start_x, start_y = _rng.randint(-100, 100), _rng.randint(-100, 100)
+        ctrl_x, ctrl_y = _rng.randint(-150, 150), _rng.randint(-150, 150)
+        steps = _rng.randint(4, 6)
+        
+        builder = ActionBuilder(driver)
+        pointer = builder.pointer_action.source
+        for i in range(steps + 1):
+            t = i / steps
+            x = (1 - t) ** 2 * start_x + 2 * (1 - t) * t * ctrl_x
+            y = (1 - t) ** 2 * start_y + 2 * (1 - t) * t * ctrl_y
+            pointer.create_pointer_move(
+                duration=_rng.randint(40, 120),
+                x=int(x),
+                y=int(y),
+                origin=element
+            )
+        builder.perform()
         human_delay(0.5, 1.5)
-    except:
+    except (MoveTargetOutOfBoundsException, WebDriverException):
         pass  # Silently fail if mouse movement doesn't work
 
+# Eased scroll driven by requestAnimationFrame; calls back when finished
+_SCROLL_SCRIPT = """
+    var amount = arguments[0], duration = arguments[1];
+    var done = arguments[arguments.length - 1];
+    var start = window.pageYOffset || 0, t0 = performance.now();
+    function step(t) {
+        var p = Math.min(1, (t - t0) / duration);
+        window.scrollTo(0, start + amount * (1 - Math.pow(1 - p, 3)));
+        if (p < 1) { requestAnimationFrame(step); } else { done(); }
+    }
+    requestAnimationFrame(step);
+"""
+
 def scroll_slowly(driver, scroll_amount=300):
     """
     Scroll page slowly to mimic human browsing
     
+    The whole animation runs in the browser in a single WebDriver call,
+    taking about as long as scrolling 20-50px every 0.1-0.3s would.
+    
     Args:
         driver: Selenium WebDriver instance
         scroll_amount: Pixels to scroll
     """
     try:
-        current_position = driver.execute_script("return window.pageYOffset;")
-        
-        # Handle None values
-        if current_position is None:
-            current_position = 0
         if scroll_amount is None:
             scroll_amount = 300
-            
-        target_position = current_position + scroll_amount
         
-        # Scroll in small increments
-        while current_position < target_position:
-            current_position += random.randint(20, 50)
-            driver.execute_script(f"window.scrollTo(0, {current_position});")
-            time.sleep(random.uniform(0.1, 0.3))
+        duration_ms = (scroll_amount / 35) * _rng.uniform(100, 300)
+        driver.execute_async_script(_SCROLL_SCRIPT, scroll_amount, duration_ms)
     except Exception:
         # If scroll fails, just continue
-        pass
\ No newline at end of file
+        pass
@@ -1,80 +1,490 @@
-from flask import Flask, request, jsonify
+from flask import Flask, g, request, jsonify
+from flask.json.provider import DefaultJSONProvider
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.common.keys import Keys
+from selenium.common.exceptions import ElementClickInterceptedException, StaleElementReferenceException
 from linkedin_bot import LinkedInBot
+from anti_detection import HumanRhythm, _rng, human_delay, retry_with_backoff, scroll_slowly
 from config import Config
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
+import atexit
+import logging
+import logging.handlers
+import math
+import queue
+import re
 import threading
 import time
-import random
+import orjson
+from cachetools import TTLCache
+
+# Log through a queue drained by a background thread, so request threads
+# never block on stderr writes
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s %(message)s',
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+logger = logging.getLogger(__name__)
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson (used by jsonify and get_json)"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response (no str round-trip)
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default), mimetype=self.mimetype
+        )
 
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 
-# Global bot instance (stays logged in between requests)
-bot = None
-bot_lock = threading.Lock()
+class PoolBusy(Exception):
+    """Raised when no bot is free and the caller asked not to wait"""
 
-def get_bot():
+class Pacer:
+    """
+    Keeps a random MIN..MAX second gap between LinkedIn write actions
+    
+    Rather than sleeping in a worker thread until the gap has passed, take()
+    tells an early caller how long to wait so it can be sent away with 429.
     """
-    Get or create bot instance
-    If session is dead, automatically create a new one
+    
+    def __init__(self, min_gap, max_gap):
+        """
+        Args:
+            min_gap: Minimum seconds between actions
+            max_gap: Maximum seconds between actions
+        """
+        self.min_gap = min_gap
+        self.max_gap = max_gap
+        self._next_allowed = 0.0
+        self._claim = None  # (previous, new) _next_allowed of the last take()
+        self._lock = threading.Lock()
+    
+    def take(self):
+        """
+        Claim the next action slot if it is due
+        
+        Returns:
+            float: 0 if the caller may act now, else seconds until it may
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now < self._next_allowed:
+                return self._next_allowed - now
+            previous = self._next_allowed
+            self._next_allowed = now + _rng.uniform(self.min_gap, self.max_gap)
+            self._claim = (previous, self._next_allowed)
+            return 0
+    
+    def refund(self):
+        """
+        Give back the last claimed slot
+        
+        Only for actions that never reached LinkedIn (nothing was clicked) -
+        a failure after the click still counts against the pacing gap.
+        """
+        with self._lock:
+            if self._claim and self._claim[1] == self._next_allowed:
+                self._next_allowed = self._claim[0]
+            self._claim = None
+
+class BotPool:
     """
-    global bot
-    with bot_lock:
+    Fixed-size pool of warm, logged-in LinkedInBot instances
+    
+    Each slot owns its own Chrome profile and session file. A handler leases
+    one slot for the duration of a LinkedIn action, so up to `size` actions
+    run in parallel and a dead session only affects its own slot.
+    """
+    
+    def __init__(self, size):
+        self.size = size
+        self._bots = [None] * size
+        self._free = queue.Queue()
+        for slot in range(size):
+            self._free.put(slot)
+    
+    def acquire(self, blocking=True):
+        """
+        Lease a free slot and return its bot, (re)creating it if needed
+        
+        Args:
+            blocking: Wait for a slot to free up instead of raising PoolBusy
+            
+        Returns:
+            LinkedInBot - must be handed back with release()
+        """
+        try:
+            slot = self._free.get(block=blocking)
+        except queue.Empty:
+            raise PoolBusy("All bots are busy")
+        
+        try:
+            return self._ensure(slot)
+        except Exception:
+            self._free.put(slot)
+            raise
+    
+    def release(self, bot_instance):
+        """Return a leased bot's slot to the pool"""
+        self._free.put(bot_instance.slot)
+    
+    @contextmanager
+    def lease(self, blocking=True):
+        """Context manager around acquire()/release()"""
+        bot_instance = self.acquire(blocking)
+        try:
+            yield bot_instance
+        finally:
+            self.release(bot_instance)
+    
+    def mark_alive(self, bot_instance):
+        """Record that the bot's session just worked, so the next lease skips its probe"""
+        bot_instance.last_verified = time.monotonic()
+    
+    def discard(self, bot_instance):
+        """Close a leased bot whose session broke; its slot is rebuilt on next lease"""
+        bot_instance.last_verified = 0.0
+        if self._bots[bot_instance.slot] is bot_instance:
+            self._bots[bot_instance.slot] = None
+        try:
+            bot_instance.close()
+        except Exception:
+            pass  # Ignore errors closing dead session
+    
+    def close_all(self):
+        """Close every bot in the pool"""
+        for slot, bot_instance in enumerate(self._bots):
+            if bot_instance is not None:
+                self._bots[slot] = None
+                try:
+                    bot_instance.close()
+                except Exception as e:
+                    logger.warning(f"⚠️  Could not close bot (slot {slot}): {str(e)[:50]}")
+    
+    def bots(self):
+        """Snapshot of the live bots (no locking)"""
+        return [b for b in list(self._bots) if b is not None]
+    
+    def free_count(self):
+        return self._free.qsize()
+    
+    def _ensure(self, slot):
+        """
+        Get the slot's bot, or create one if it's missing or its session died
+        
+        Only called by the thread holding the slot's lease, so no locking.
+        """
+        current = self._bots[slot]
+        
         # If bot exists, check if it's still alive
-        if bot is not None:
+        if current is not None:
+            # Used moments ago - no need for a WebDriver round-trip
+            if time.monotonic() - current.last_verified < Config.SESSION_CHECK_TTL:
+                return current
+            
             try:
                 # Quick health check - can we access the browser?
-                _ = bot.driver.current_url
-                print("✅ Using existing bot session")
-                return bot
+                _ = current.driver.current_url
+                current.last_verified = time.monotonic()
+                logger.info(f"✅ Using existing bot session (slot {slot})")
+                return current
             except Exception as e:
                 # Session is dead - clean it up and create new one
-                print(f"⚠️  Bot session died: {str(e)[:50]}")
-                print("🔄 Spinning up new bot instance...")
-                try:
-                    bot.close()
-                except:
-                    pass  # Ignore errors closing dead session
-                bot = None
+                current.last_verified = 0.0
+                logger.warning(f"⚠️  Bot session died (slot {slot}): {str(e)[:50]}")
+                logger.info("🔄 Spinning up new bot instance...")
+        
+        # Keep the dead bot's chromedriver running while we try to reattach
+        # (a reattached bot's driver has no .service - the bot still holds it)
+        dead_service = None
+        if current is not None:
+            dead_service = getattr(current.driver, 'service', None) or current._service
+        
+        # Cheapest recovery: reattach to the saved browser session
+        revived = LinkedInBot.reattach(slot=slot, service=dead_service)
+        if revived is not None:
+            self._bots[slot] = revived
+            logger.info(f"✅ Bot ready (slot {slot}, reattached to existing session)")
+            return revived
+        
+        if current is not None:
+            self.discard(current)
         
         # Create fresh bot instance
-        if bot is None:
-            print("🤖 Creating new LinkedIn bot instance...")
-            bot = LinkedInBot()
-            
-            print("🔐 Logging in to LinkedIn...")
-            if not bot.login():
-                bot = None
-                raise Exception("Failed to login to LinkedIn")
-            
-            print("✅ Bot ready and logged in!")
+        logger.info(f"🤖 Creating new LinkedIn bot instance (slot {slot})...")
+        new_bot = LinkedInBot(slot=slot)
+        
+        logger.info("🔐 Logging in to LinkedIn...")
+        if not new_bot.login():
+            new_bot.close()
+            raise Exception("Failed to login to LinkedIn")
+        
+        try:
+            new_bot.save_session()
+        except Exception as e:
+            logger.warning(f"⚠️  Could not save session: {str(e)[:50]}")
         
-        return bot
+        new_bot.last_verified = time.monotonic()
+        self._bots[slot] = new_bot
+        logger.info(f"✅ Bot ready and logged in! (slot {slot})")
+        return new_bot
+
+# Warm bots shared by all requests (stay logged in between requests)
+pool = BotPool(Config.BOT_POOL_SIZE)
+
+# Spacing between connection requests / comments (see Config.ENFORCE_PACING)
+pacer = Pacer(Config.MIN_DELAY_SECONDS, Config.MAX_DELAY_SECONDS)
+
+# Held while a background warm-up is running (see start_warmup)
+warmup_lock = threading.Lock()
+WARMUP_STAGGER_SECONDS = 0.5
+
+SEND_RETRY_AFTER_SECONDS = 30
+
+# Click errors that usually clear up if we try again a moment later
+RETRYABLE_CLICK_ERRORS = (StaleElementReferenceException, ElementClickInterceptedException)
+
+# How long to wait for the comment box to open after clicking Comment
+COMMENT_BOX_TIMEOUT_MS = 5000
+
+# How long to wait for the comment box to clear after submitting
+SUBMIT_TIMEOUT_MS = 4000
+
+# Separator line around each request's log header
+BANNER = '=' * 60
+
+# Results of completed actions, so a retried request is answered without
+# repeating the LinkedIn action (keyed by action_id or endpoint+prospect_id)
+_done_cache = TTLCache(maxsize=10_000, ttl=Config.IDEMPOTENCY_TTL_MINUTES * 60)
+_done_lock = threading.Lock()
+
+def cached_result(key):
+    """Result previously stored for key, or None"""
+    if not key:
+        return None
+    with _done_lock:
+        return _done_cache.get(key)
+
+def remember_result(key, result):
+    """Store a successful action's response body under key"""
+    if not key:
+        return
+    with _done_lock:
+        _done_cache[key] = result
+
+def prospect_key(prospect_id):
+    """Idempotency key for the warmup endpoints (None if prospect unknown)"""
+    if not prospect_id or prospect_id == 'unknown':
+        return None
+    return (request.endpoint, prospect_id)
+
+# (iso string, epoch second) - /health is polled far more often than once a second
+_cached_ts = ('', 0)
+
+def now_iso():
+    """Current local time as ISO-8601, formatted at most once per second"""
+    global _cached_ts
+    t = int(time.time())
+    if _cached_ts[1] != t:
+        _cached_ts = (datetime.fromtimestamp(t).isoformat(), t)
+    return _cached_ts[0]
+
+@app.before_request
+def stamp_request():
+    """Stamp the request once; handlers reuse g.ts in their responses"""
+    g.ts = now_iso()
+
+# Error messages that mean the bot's browser/session is gone
+SESSION_ERROR_RE = re.compile(r'session|chrome|driver', re.IGNORECASE)
+
+def discard_if_session_error(bot_instance, error_msg):
+    """
+    Drop bot_instance from the pool if error_msg points at a dead browser
+    
+    Args:
+        bot_instance: Bot that was leased when the error happened (or None)
+        error_msg: The error's message
+    
+    Returns:
+        bool: True if the bot was discarded - call start_warmup() once it
+        has been released so the slot is rebuilt in the background
+    """
+    if bot_instance is None or not SESSION_ERROR_RE.search(error_msg):
+        return False
+    
+    logger.info("🔄 Marking bot for recreation on next request...")
+    pool.discard(bot_instance)
+    return True
+
+def start_warmup():
+    """
+    Create and log in the pool's bots in a background thread
+    
+    Lets the next request find a warm, logged-in bot instead of paying for
+    Chrome startup + login itself. No-op if a warm-up is already running.
+    """
+    if not warmup_lock.acquire(blocking=False):
+        return
+    
+    def _warm_slot(stagger):
+        # Stagger logins so LinkedIn doesn't see them all at once from one IP
+        time.sleep(stagger)
+        try:
+            with pool.lease(blocking=False):
+                pass
+        except PoolBusy:
+            pass  # The rest are in use, so they're warm already
+        except Exception as e:
+            logger.warning(f"⚠️  Background warm-up failed: {str(e)[:100]}")
+    
+    def _warm():
+        try:
+            logger.info("🔥 Warming up bots in background...")
+            # Each worker leases a different free slot, so the bots start
+            # Chrome and log in side by side
+            with ThreadPoolExecutor(max_workers=pool.size) as executor:
+                list(executor.map(_warm_slot, [i * WARMUP_STAGGER_SECONDS for i in range(pool.size)]))
+        finally:
+            warmup_lock.release()
+    
+    threading.Thread(target=_warm, name='bot-warmup', daemon=True).start()
+
+def error_response(error, status=500, **fields):
+    """
+    Build the standard failure response
+    
+    Args:
+        error: Error message for the 'error' field
+        status: HTTP status code
+        **fields: Extra fields to include (prospect_id, timestamp, ...)
+    
+    Returns:
+        tuple: (response, status) ready to return from a view
+    """
+    return jsonify({'success': False, 'error': error, **fields}), status
+
+def pace_or_reject(**fields):
+    """
+    Reject a LinkedIn write action that comes too soon after the last one
+    
+    Args:
+        **fields: Extra fields for the 429 body (prospect_id, action_id, ...)
+    
+    Returns:
+        tuple: (response, 429) with Retry-After set, or None to go ahead
+    """
+    if not Config.ENFORCE_PACING:
+        return None
+    
+    wait = pacer.take()
+    if not wait:
+        return None
+    
+    retry_after = math.ceil(wait)
+    logger.info(f"⏳ Too soon after the last action - retry in {retry_after}s")
+    response, status = error_response('too_soon', 429, retry_after=retry_after, **fields)
+    response.headers['Retry-After'] = str(retry_after)
+    return response, status
 
 @app.route('/health', methods=['GET'])
 def health():
-    """Health check endpoint"""
+    """
+    Health check endpoint
+    
+    Never blocks: reads a snapshot of the pool and reports 'busy' when
+    every bot is leased.
+    """
+    bots = pool.bots()
     return jsonify({
         'status': 'online',
-        'timestamp': datetime.now().isoformat(),
-        'logged_in': bot.logged_in if bot else False
+        'timestamp': g.ts,
+        'logged_in': any(b.logged_in for b in bots),
+        'busy': pool.free_count() == 0
     })
 
 @app.route('/login', methods=['POST'])
 def login():
-    """Force login/re-login"""
+    """
+    Login (idempotent)
+    
+    Returns the cached state if the bot logged in recently.
+    Pass ?force=true to re-check the session anyway.
+    """
     try:
-        bot_instance = get_bot()
-        success = bot_instance.login()
+        force = request.args.get('force', '').lower() == 'true'
+        
+        with pool.lease() as bot_instance:
+            last_login = bot_instance.last_login_ts
+            fresh = last_login is not None and time.time() - last_login < Config.LOGIN_CACHE_MINUTES * 60
+            if bot_instance.logged_in and fresh and not force:
+                return jsonify({
+                    'success': True,
+                    'message': 'Already logged in',
+                    'cached': True
+                })
+            
+            success = bot_instance.login(force=True)
         
         return jsonify({
             'success': success,
-            'message': 'Login successful' if success else 'Login failed'
+            'message': 'Login successful' if success else 'Login failed',
+            'cached': False
         })
     except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        return error_response(str(e))
+
+# Expected body fields for /send-connection: name -> (required, default)
+SEND_CONNECTION_FIELDS = {
+    'linkedin_url': (True, None),
+    'connection_note': (False, ''),
+    'prospect_id': (True, None),
+    'action_id': (False, None),
+}
+
+def parse_json_body(fields):
+    """
+    Decode and validate the request's JSON body against a field spec
+    
+    Args:
+        fields: dict of field name -> (required, default); values must be strings
+        
+    Returns:
+        (data, None) with exactly the spec'd fields, or (None, error response)
+    """
+    body = request.get_json(silent=True)
+    if not body or not isinstance(body, dict):
+        return None, error_response('No data provided', 400)
+    
+    data = {}
+    for name, (required, default) in fields.items():
+        value = body.get(name)
+        if value is None or value == '':
+            if required:
+                return None, error_response(f'{name} is required', 400)
+            value = default
+        elif not isinstance(value, str):
+            return None, error_response(f'{name} must be a string', 400)
+        data[name] = value
+    
+    return data, None
 
 @app.route('/send-connection', methods=['POST'])
 def send_connection():
@@ -89,84 +499,435 @@ def send_connection():
         "action_id": "patrick_stripe_001_linkedin_001"
     }
     """
+    data = None
+    bot_instance = None
+    recreate = False
+    paced = False
     try:
-        data = request.json
+        # Decode + validate all fields in one pass
+        data, error = parse_json_body(SEND_CONNECTION_FIELDS)
+        if error:
+            return error
         
-        # Validate required fields
-        if not data:
-            return jsonify({
-                'success': False,
-                'error': 'No data provided'
-            }), 400
+        linkedin_url = data['linkedin_url']
+        connection_note = data['connection_note']
+        prospect_id = data['prospect_id']
+        action_id = data['action_id']
         
-        linkedin_url = data.get('linkedin_url')
-        connection_note = data.get('connection_note', '')
-        prospect_id = data.get('prospect_id')
-        action_id = data.get('action_id')
+        cached = cached_result(action_id)
+        if cached is not None:
+            logger.info(f"♻️  Action {action_id} already done - returning saved result")
+            return jsonify(cached), 200
         
-        if not linkedin_url:
-            return jsonify({
-                'success': False,
-                'error': 'linkedin_url is required'
-            }), 400
-        
-        if not prospect_id:
-            return jsonify({
-                'success': False,
-                'error': 'prospect_id is required'
-            }), 400
-        
-        print(f"\n{'='*60}")
-        print(f"📨 NEW CONNECTION REQUEST")
-        print(f"{'='*60}")
-        print(f"Prospect ID: {prospect_id}")
-        print(f"Action ID: {action_id}")
-        print(f"Profile URL: {linkedin_url}")
-        print(f"Message Length: {len(connection_note)} chars")
-        print(f"{'='*60}\n")
-        
-        # Get bot instance (creates new one if session died)
-        bot_instance = get_bot()
-        
-        # Send connection request
-        result = bot_instance.send_connection_request(linkedin_url, connection_note)
+        logger.debug(BANNER)
+        logger.info("📨 NEW CONNECTION REQUEST")
+        logger.debug(BANNER)
+        logger.info(f"Prospect ID: {prospect_id}")
+        logger.info(f"Action ID: {action_id}")
+        logger.info(f"Profile URL: {linkedin_url}")
+        logger.info(f"Message Length: {len(connection_note)} chars")
+        logger.debug(BANNER)
+        
+        # If every bot is busy, tell the caller to retry instead of
+        # queueing it behind the requests in flight
+        try:
+            # Get bot instance (creates new one if session died)
+            bot_instance = pool.acquire(blocking=False)
+        except PoolBusy:
+            logger.info("⏳ All bots are busy with other requests - rejecting")
+            response, status = error_response(
+                'busy', 429,
+                retry_after=SEND_RETRY_AFTER_SECONDS,
+                prospect_id=prospect_id,
+                action_id=action_id
+            )
+            response.headers['Retry-After'] = str(SEND_RETRY_AFTER_SECONDS)
+            return response, status
+        
+        # Only claim the pacing slot once we hold a bot, so a busy reply
+        # doesn't push back the caller's retry
+        rejected = pace_or_reject(prospect_id=prospect_id, action_id=action_id)
+        if rejected:
+            return rejected
+        paced = Config.ENFORCE_PACING
+        
+        # Send connection request (all human delays share one time budget)
+        with HumanRhythm(Config.REQUEST_DELAY_BUDGET):
+            result = bot_instance.send_connection_request(linkedin_url, connection_note)
         
         # Add tracking info to result
         result['prospect_id'] = prospect_id
         result['action_id'] = action_id
-        result['timestamp'] = datetime.now().isoformat()
+        result['timestamp'] = g.ts
         
         if result['success']:
-            print(f"\n✅ SUCCESS: Connection request sent to {prospect_id}\n")
+            pool.mark_alive(bot_instance)
+            remember_result(action_id, result)
+            logger.info(f"✅ SUCCESS: Connection request sent to {prospect_id}")
             return jsonify(result), 200
         else:
-            print(f"\n❌ FAILED: {result.get('error')}\n")
+            logger.error(f"❌ FAILED: {result.get('error')}")
+            # Nothing was clicked (login/navigation failed, no action found)
+            if paced and not bot_instance.action_clicked:
+                pacer.refund()
             return jsonify(result), 500
             
     except Exception as e:
         error_msg = str(e)
-        print(f"\n❌ ERROR: {error_msg}\n")
-        
-        # If ANY error occurs, mark bot as needing recreation
-        # Next request will get a fresh bot instance
-        global bot
-        if 'session' in error_msg.lower() or 'chrome' in error_msg.lower() or 'driver' in error_msg.lower():
-            print("🔄 Marking bot for recreation on next request...")
-            with bot_lock:
-                try:
-                    if bot:
-                        bot.close()
-                except:
-                    pass
-                bot = None
+        logger.error(f"❌ ERROR: {error_msg}")
         
-        return jsonify({
-            'success': False,
-            'error': error_msg,
-            'prospect_id': data.get('prospect_id') if data else None,
-            'action_id': data.get('action_id') if data else None,
-            'timestamp': datetime.now().isoformat()
-        }), 500
+        # Nothing reached LinkedIn - don't hold the caller's retry to the pacing gap
+        if paced and not bot_instance.action_clicked:
+            pacer.refund()
+        
+        # Browser-level failure: drop the bot so the next request gets a fresh one
+        recreate = discard_if_session_error(bot_instance, error_msg)
+        
+        return error_response(
+            error_msg,
+            prospect_id=data.get('prospect_id') if data else None,
+            action_id=data.get('action_id') if data else None,
+            timestamp=g.ts
+        )
+    finally:
+        if bot_instance is not None:
+            pool.release(bot_instance)
+        if recreate:
+            start_warmup()
+
+# Selectors and injected scripts for the warmup (react/comment) handlers
+REACT_BTN_XPATH = "//button[contains(@aria-label, 'React') or contains(@aria-label, 'Like')]"
+COMMENT_BTN_XPATH = "//button[contains(@aria-label, 'Comment') or contains(@class, 'comment-button')]"
+SUBMIT_BTN_XPATH = "//button[contains(@class, 'comments-comment-box__submit-button')]"
+# The request LinkedIn's web client makes to create a comment (JS regex) -
+# keep it specific so comment-list fetches don't count as a post
+COMMENT_API_PATTERN = r'/voyager/api/voyagerSocialDashNormComments'
+COMMENT_BOX_SELECTORS = (
+    "//div[@role='textbox' and @contenteditable='true']",
+    "//div[contains(@class, 'ql-editor')]",
+    "//div[@data-placeholder='Add a comment…']",
+    "//div[contains(@class, 'comments-comment-box__form')]//div[@contenteditable='true']",
+)
+
+# Resolve the comment box in a single round-trip: first selector in
+# arguments[0] that matches, last match wins. If it isn't there yet, watch
+# the DOM for up to arguments[1] ms for it to appear.
+# Calls back with {box, selector}.
+FIND_COMMENT_UI_JS = """
+    var selectors = arguments[0], timeout = arguments[1];
+    var done = arguments[arguments.length - 1];
+
+    function last(xpath) {
+        var r = document.evaluate(xpath, document, null,
+                                  XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        return r.snapshotLength ? r.snapshotItem(r.snapshotLength - 1) : null;
+    }
+
+    function find() {
+        for (var i = 0; i < selectors.length; i++) {
+            var box = last(selectors[i]);
+            if (box) return {box: box, selector: selectors[i]};
+        }
+        return null;
+    }
+
+    var found = find();
+    if (found || !timeout) {
+        done(found || {box: null, selector: null});
+        return;
+    }
+
+    // Re-run the lookup at most once per frame while the DOM is changing
+    var pending = false, timer;
+    var observer = new MutationObserver(function () {
+        if (pending) return;
+        pending = true;
+        requestAnimationFrame(function () {
+            pending = false;
+            var f = find();
+            if (f) {
+                observer.disconnect();
+                clearTimeout(timer);
+                done(f);
+            }
+        });
+    });
+    observer.observe(document.body, {childList: true, subtree: true});
+    timer = setTimeout(function () {
+        observer.disconnect();
+        done(find() || {box: null, selector: null});
+    }, timeout);
+"""
+
+# Put arguments[1] into contenteditable arguments[0] as plain text and fire
+# the input event LinkedIn listens for
+SET_BOX_TEXT_JS = """
+    arguments[0].textContent = arguments[1];
+    arguments[0].dispatchEvent(new Event('input', {bubbles: true}));
+"""
+GET_BOX_CONTENT_JS = "return arguments[0].innerHTML || arguments[0].textContent || '';"
+
+# For comment box arguments[0] holding text arguments[1]: if arguments[2],
+# find the submit button (the box's form first, else the last match of XPath
+# arguments[3]), scroll it in, wait a frame and click it with the full event
+# sequence Ember listens for. Then wait until LinkedIn's comment API call
+# (URL matching regex arguments[5]) succeeds, or (MutationObserver) the box
+# or button is gone or the box no longer holds the text; gives up after
+# arguments[4] ms.
+# Calls back with {clicked, posted}.
+SUBMIT_COMMENT_JS = """
+    var box = arguments[0], text = arguments[1], click = arguments[2];
+    var submitXPath = arguments[3], timeout = arguments[4], apiPattern = arguments[5];
+    var done = arguments[arguments.length - 1];
+    var clicked = false;
+
+    function findButton() {
+        var form = box.closest('form');
+        var button = form && form.querySelector(
+            'button[class*="comments-comment-box__submit-button"], button[type="submit"]');
+        if (button) return button;
+        var r = document.evaluate(submitXPath, document, null,
+                                  XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        return r.snapshotLength ? r.snapshotItem(r.snapshotLength - 1) : null;
+    }
+
+    function clickButton(button) {
+        button.disabled = false;
+        button.removeAttribute('disabled');
+        button.focus();
+
+        var m = {view: window, bubbles: true, cancelable: true, buttons: 1};
+        var p = {view: window, bubbles: true, cancelable: true, isPrimary: true};
+        button.dispatchEvent(new PointerEvent('pointerdown', p));
+        button.dispatchEvent(new MouseEvent('mousedown', m));
+        button.dispatchEvent(new PointerEvent('pointerup', p));
+        button.dispatchEvent(new MouseEvent('mouseup', m));
+        button.dispatchEvent(new MouseEvent('click', m));
+        clicked = true;
+    }
+
+    // LinkedIn drops the box or the submit button as soon as the comment
+    // is posted - either is a surer sign than comparing text
+    function posted() {
+        if (!box.isConnected || (button && !button.isConnected)) return true;
+        var current = (box.innerText || '').trim();
+        return !current || current.indexOf(text) < 0;
+    }
+
+    // Re-check on every DOM change instead of polling; body childList
+    // catches the box being removed, the box itself catches text edits
+    function watch() {
+        var finished = false, observer, network = null, timer;
+        function finish(ok) {
+            if (finished) return;
+            finished = true;
+            observer.disconnect();
+            if (network) network.disconnect();
+            clearTimeout(timer);
+            done({clicked: clicked, posted: ok});
+        }
+        observer = new MutationObserver(function () {
+            if (posted()) finish(true);
+        });
+        observer.observe(box, {childList: true, subtree: true, characterData: true});
+        observer.observe(document.body, {childList: true, subtree: true});
+
+        // A 2xx from the comment API is the most direct signal; Resource
+        // Timing only reads what the page already fetched, nothing is patched
+        if (apiPattern && window.PerformanceObserver) {
+            var api = new RegExp(apiPattern);
+            network = new PerformanceObserver(function (list) {
+                list.getEntries().forEach(function (e) {
+                    if ((e.initiatorType === 'fetch' || e.initiatorType === 'xmlhttprequest') &&
+                        api.test(e.name) && e.responseStatus >= 200 && e.responseStatus < 300) {
+                        finish(true);
+                    }
+                });
+            });
+            network.observe({type: 'resource'});
+        }
+        timer = setTimeout(function () { finish(posted()); }, timeout);
+        if (posted()) finish(true);
+    }
+
+    var button = click ? findButton() : null;
+    if (button) {
+        // Let layout settle after scrolling before clicking
+        button.scrollIntoView({block: 'center'});
+        requestAnimationFrame(function () {
+            clickButton(button);
+            watch();
+        });
+    } else {
+        watch();
+    }
+"""
+
+# Pause between characters in CHAR_BY_CHAR_JS (ms), and the extra script
+# timeout allowed on top of the slowest possible run
+CHAR_DELAY_MS = (50, 150)
+CHAR_BY_CHAR_MARGIN_SECONDS = 30
+
+# Append arguments[1] to contenteditable arguments[0] one character at a time,
+# firing an input event per character and pausing a random
+# arguments[2]..arguments[3] ms between them; calls back when done
+CHAR_BY_CHAR_JS = """
+    var box = arguments[0], text = arguments[1];
+    var minDelay = arguments[2], maxDelay = arguments[3];
+    var done = arguments[arguments.length - 1];
+    var target = box.querySelector('p') || box;
+    var i = 0;
+    
+    box.focus();
+    function typeNext() {
+        if (i >= text.length) {
+            done();
+            return;
+        }
+        var ch = text[i++];
+        target.appendChild(document.createTextNode(ch));
+        box.dispatchEvent(new InputEvent('input', {bubbles: true, data: ch, inputType: 'insertText'}));
+        setTimeout(typeNext, minDelay + Math.random() * (maxDelay - minDelay));
+    }
+    typeNext();
+"""
+
+def find_comment_ui(driver, timeout_ms=COMMENT_BOX_TIMEOUT_MS):
+    """
+    Locate the open comment box, trying every selector in one call
+    
+    Args:
+        driver: Selenium WebDriver instance
+        timeout_ms: How long to wait for the box to appear (0 = don't wait)
+    
+    Returns:
+        dict: 'box' and the 'selector' that found it (both None if not found)
+    """
+    return driver.execute_async_script(
+        FIND_COMMENT_UI_JS, list(COMMENT_BOX_SELECTORS), timeout_ms
+    ) or {}
+
+# Per-thread ActionChains, rebuilt only when the thread moves to another driver
+_tls = threading.local()
+
+def get_actions(driver):
+    """
+    Get this thread's ActionChains for driver
+    
+    ActionChains clears its queued actions on perform(), so one instance can
+    be reused for every chain a worker thread builds against the same driver.
+    
+    Args:
+        driver: Selenium WebDriver instance
+    
+    Returns:
+        ActionChains: Empty action chain bound to driver
+    """
+    actions = getattr(_tls, 'actions', None)
+    if actions is None or actions._driver is not driver:
+        # No 250ms default pointer-move duration - these chains aren't the
+        # human-looking moves (random_mouse_movement does those)
+        actions = _tls.actions = ActionChains(driver, duration=0)
+    return actions
+
+def wait_comment_posted(driver, comment_box, comment_text, click=False,
+                        timeout_ms=SUBMIT_TIMEOUT_MS):
+    """
+    Optionally click submit, then wait for the comment box to clear
+    
+    Finding the button, clicking it and watching the box all happen in one
+    browser round-trip.
+    
+    Args:
+        driver: Selenium WebDriver instance
+        comment_box: The comment box element
+        comment_text: The text that was typed
+        click: Find and click the submit button before waiting
+        timeout_ms: How long to wait for the box to clear
+    
+    Returns:
+        bool: True if our text left the box (comment posted)
+    """
+    try:
+        outcome = driver.execute_async_script(
+            SUBMIT_COMMENT_JS, comment_box, comment_text.strip(), click,
+            SUBMIT_BTN_XPATH, timeout_ms, COMMENT_API_PATTERN
+        ) or {}
+    except StaleElementReferenceException:
+        logger.info("  ✅ VERIFIED: Comment box no longer accessible (posted!)")
+        return True
+    
+    if click and not outcome.get('clicked'):
+        logger.warning("  ⚠️ Submit button not found")
+    if outcome.get('posted'):
+        logger.info("  ✅ VERIFIED: Our comment text is gone from the box!")
+        return True
+    return False
+
+def _type_with_js(driver, box, text):
+    # Text is passed as an argument, never spliced into the script
+    driver.execute_script(SET_BOX_TEXT_JS, box, text)
+
+def _type_with_send_keys(driver, box, text):
+    box.send_keys(text)
+
+def _type_with_actions(driver, box, text):
+    get_actions(driver).move_to_element(box).click().send_keys(text).perform()
+
+def _type_char_by_char(driver, box, text):
+    box.clear()
+    # Type slowly - the whole loop runs in the browser, so give the script
+    # time for the slowest case (a 1,250-char comment needs ~190s)
+    min_delay, max_delay = CHAR_DELAY_MS
+    previous = driver.timeouts.script
+    driver.set_script_timeout(len(text) * max_delay / 1000 + CHAR_BY_CHAR_MARGIN_SECONDS)
+    try:
+        driver.execute_async_script(CHAR_BY_CHAR_JS, box, text, min_delay, max_delay)
+    finally:
+        driver.set_script_timeout(previous)
+
+# Ways to get text into LinkedIn's contenteditable comment box, best first
+COMMENT_TYPING_METHODS = (
+    ('JavaScript textContent', _type_with_js),
+    ('send_keys', _type_with_send_keys),
+    ('ActionChains', _type_with_actions),
+    ('character-by-character', _type_char_by_char),
+)
+
+def type_comment(driver, comment_box, comment_text):
+    """
+    Type a comment, falling through COMMENT_TYPING_METHODS until one sticks
+    
+    Each method is followed by a single content read; the first method that
+    leaves text in the box ends the ladder. Only a failed method is followed
+    by a pause, to let the page settle before the next one.
+    
+    Args:
+        driver: Selenium WebDriver instance
+        comment_box: The comment box element
+        comment_text: Text to type
+    
+    Returns:
+        bool: True if the box has content
+    """
+    for number, (name, method) in enumerate(COMMENT_TYPING_METHODS, 1):
+        logger.info(f"  📝 Method {number}: {name}...")
+        try:
+            method(driver, comment_box, comment_text)
+            content = driver.execute_script(GET_BOX_CONTENT_JS, comment_box)
+        except Exception as e:
+            logger.warning(f"  ⚠️ Method {number} failed: {str(e)[:50]}")
+            human_delay(0.5, 1)
+            continue
+        
+        if content and content.strip():
+            logger.info(f"  ✅ Comment typed ({name})")
+            logger.info(f"  📝 Content: {content[:50]}...")
+            return True
+        logger.warning(f"  ⚠️ {name} executed but no content")
+        human_delay(0.5, 1)
+    
+    return False
 
 @app.route('/visit-profile', methods=['POST'])
 def visit_profile():
@@ -179,73 +940,79 @@ def visit_profile():
         "prospect_id": "patrick_stripe_001"
     }
     """
+    data = None
+    bot_instance = None
+    recreate = False
     try:
         data = request.json
         
         if not data:
-            return jsonify({
-                'success': False,
-                'error': 'No data provided'
-            }), 400
+            return error_response('No data provided', 400)
         
         linkedin_url = data.get('linkedin_url')
         prospect_id = data.get('prospect_id', 'unknown')
         
         if not linkedin_url:
-            return jsonify({
-                'success': False,
-                'error': 'linkedin_url is required'
-            }), 400
-        
-        print(f"\n{'='*60}")
-        print(f"👀 PROFILE VISIT (WARMUP)")
-        print(f"{'='*60}")
-        print(f"Prospect ID: {prospect_id}")
-        print(f"Profile URL: {linkedin_url}")
-        print(f"{'='*60}\n")
+            return error_response('linkedin_url is required', 400)
+        
+        done_key = prospect_key(prospect_id)
+        cached = cached_result(done_key)
+        if cached is not None:
+            logger.info(f"♻️  Already done for {prospect_id} - returning saved result")
+            return jsonify(cached), 200
+        
+        logger.debug(BANNER)
+        logger.info("👀 PROFILE VISIT (WARMUP)")
+        logger.debug(BANNER)
+        logger.info(f"Prospect ID: {prospect_id}")
+        logger.info(f"Profile URL: {linkedin_url}")
+        logger.debug(BANNER)
         
         # Get bot instance
-        bot_instance = get_bot()
+        bot_instance = pool.acquire()
         
         # Navigate to profile
-        print(f"🌐 Navigating to profile...")
+        logger.info("🌐 Navigating to profile...")
         bot_instance.driver.get(linkedin_url)
-        from anti_detection import human_delay, scroll_slowly
         human_delay(5, 8)
         
-        # Scroll down slowly (reading profile)
-        print("📜 Scrolling through profile...")
-        scroll_slowly(bot_instance.driver, 300)
-        human_delay(3, 5)
-        
-        # Scroll again
-        scroll_slowly(bot_instance.driver, 300)
+        # Scroll down slowly (reading profile) - one animation, one round-trip
+        logger.info("📜 Scrolling through profile...")
+        scroll_slowly(bot_instance.driver, 600)
         human_delay(3, 5)
         
         # Stay for 10-20 seconds (human reading)
-        print("📖 Reading profile content...")
+        logger.info("📖 Reading profile content...")
         human_delay(10, 20)
         
-        print("✅ Profile visit completed!")
+        logger.info("✅ Profile visit completed!")
+        pool.mark_alive(bot_instance)
         
-        return jsonify({
+        result = {
             'success': True,
             'action_taken': 'profile_visit',
             'profile_url': linkedin_url,
             'prospect_id': prospect_id,
-            'timestamp': datetime.now().isoformat()
-        }), 200
+            'timestamp': g.ts
+        }
+        remember_result(done_key, result)
+        return jsonify(result), 200
         
     except Exception as e:
         error_msg = str(e)
-        print(f"\n❌ ERROR: {error_msg}\n")
+        logger.error(f"❌ ERROR: {error_msg}")
+        recreate = discard_if_session_error(bot_instance, error_msg)
         
-        return jsonify({
-            'success': False,
-            'error': error_msg,
-            'prospect_id': data.get('prospect_id') if data else None,
-            'timestamp': datetime.now().isoformat()
-        }), 500
+        return error_response(
+            error_msg,
+            prospect_id=data.get('prospect_id') if data else None,
+            timestamp=g.ts
+        )
+    finally:
+        if bot_instance is not None:
+            pool.release(bot_instance)
+        if recreate:
+            start_warmup()
 
 @app.route('/react-to-post', methods=['POST'])
 def react_to_post():
@@ -259,44 +1026,45 @@ def react_to_post():
         "reaction_type": "like"
     }
     """
+    data = None
+    bot_instance = None
+    recreate = False
     try:
         data = request.json
         
         if not data:
-            return jsonify({
-                'success': False,
-                'error': 'No data provided'
-            }), 400
+            return error_response('No data provided', 400)
         
         linkedin_url = data.get('linkedin_url')
         prospect_id = data.get('prospect_id', 'unknown')
         reaction_type = data.get('reaction_type', 'like')
         
         if not linkedin_url:
-            return jsonify({
-                'success': False,
-                'error': 'linkedin_url is required'
-            }), 400
-        
-        print(f"\n{'='*60}")
-        print(f"❤️ POST REACTION (WARMUP) - {reaction_type.upper()}")
-        print(f"{'='*60}")
-        print(f"Prospect ID: {prospect_id}")
-        print(f"Profile URL: {linkedin_url}")
-        print(f"{'='*60}\n")
+            return error_response('linkedin_url is required', 400)
+        
+        done_key = prospect_key(prospect_id)
+        cached = cached_result(done_key)
+        if cached is not None:
+            logger.info(f"♻️  Already done for {prospect_id} - returning saved result")
+            return jsonify(cached), 200
+        
+        logger.debug(BANNER)
+        logger.info(f"❤️ POST REACTION (WARMUP) - {reaction_type.upper()}")
+        logger.debug(BANNER)
+        logger.info(f"Prospect ID: {prospect_id}")
+        logger.info(f"Profile URL: {linkedin_url}")
+        logger.debug(BANNER)
         
         # Get bot instance
-        bot_instance = get_bot()
+        bot_instance = pool.acquire()
         
         # Navigate to profile
-        print(f"🌐 Navigating to profile...")
+        logger.info("🌐 Navigating to profile...")
         bot_instance.driver.get(linkedin_url)
-        from anti_detection import human_delay, scroll_slowly
-        from selenium.webdriver.common.by import By
         human_delay(5, 8)
         
         # Scroll to find posts
-        print("📜 Looking for posts...")
+        logger.info("📜 Looking for posts...")
         scroll_slowly(bot_instance.driver, 500)
         human_delay(3, 5)
         
@@ -304,45 +1072,53 @@ def react_to_post():
         reaction_success = False
         try:
             # Look for Like/React buttons
-            like_buttons = bot_instance.driver.find_elements(By.XPATH, 
-                "//button[contains(@aria-label, 'React') or contains(@aria-label, 'Like')]")
+            like_buttons = bot_instance.driver.find_elements(By.XPATH, REACT_BTN_XPATH)
             
             if like_buttons and len(like_buttons) > 0:
-                print(f"  ✅ Found {len(like_buttons)} posts with reaction buttons")
+                logger.info(f"  ✅ Found {len(like_buttons)} posts with reaction buttons")
                 
                 # Click the first one
                 first_button = like_buttons[0]
                 first_button.click()
                 human_delay(2, 4)
                 
-                print(f"  ✅ Reacted to post!")
+                logger.info("  ✅ Reacted to post!")
                 reaction_success = True
             else:
-                print("  ⚠️ No posts found with reaction buttons")
+                logger.warning("  ⚠️ No posts found with reaction buttons")
                 
         except Exception as e:
-            print(f"  ⚠️ Could not react to post: {str(e)[:100]}")
+            logger.warning(f"  ⚠️ Could not react to post: {str(e)[:100]}")
         
-        return jsonify({
+        result = {
             'success': True,
             'action_taken': 'post_reaction',
             'reaction_type': reaction_type,
             'reaction_success': reaction_success,
             'profile_url': linkedin_url,
             'prospect_id': prospect_id,
-            'timestamp': datetime.now().isoformat()
-        }), 200
+            'timestamp': g.ts
+        }
+        # Reacting again would toggle the reaction off
+        if reaction_success:
+            remember_result(done_key, result)
+        return jsonify(result), 200
         
     except Exception as e:
         error_msg = str(e)
-        print(f"\n❌ ERROR: {error_msg}\n")
+        logger.error(f"❌ ERROR: {error_msg}")
+        recreate = discard_if_session_error(bot_instance, error_msg)
         
-        return jsonify({
-            'success': False,
-            'error': error_msg,
-            'prospect_id': data.get('prospect_id') if data else None,
-            'timestamp': datetime.now().isoformat()
-        }), 500
+        return error_response(
+            error_msg,
+            prospect_id=data.get('prospect_id') if data else None,
+            timestamp=g.ts
+        )
+    finally:
+        if bot_instance is not None:
+            pool.release(bot_instance)
+        if recreate:
+            start_warmup()
 
 @app.route('/comment-on-post', methods=['POST'])
 def comment_on_post():
@@ -356,56 +1132,58 @@ def comment_on_post():
         "comment_text": "Great insights! This really resonates..."
     }
     """
+    data = None
+    bot_instance = None
+    recreate = False
+    paced = False
+    submitted = False  # The submit click was sent - the comment may be live
     try:
         data = request.json
         
         if not data:
-            return jsonify({
-                'success': False,
-                'error': 'No data provided'
-            }), 400
+            return error_response('No data provided', 400)
         
         linkedin_url = data.get('linkedin_url')
         prospect_id = data.get('prospect_id', 'unknown')
         comment_text = data.get('comment_text', '')
         
         if not linkedin_url:
-            return jsonify({
-                'success': False,
-                'error': 'linkedin_url is required'
-            }), 400
+            return error_response('linkedin_url is required', 400)
         
         if not comment_text:
-            return jsonify({
-                'success': False,
-                'error': 'comment_text is required'
-            }), 400
-        
-        print(f"\n{'='*60}")
-        print(f"💬 POST COMMENT (WARMUP)")
-        print(f"{'='*60}")
-        print(f"Prospect ID: {prospect_id}")
-        print(f"Profile URL: {linkedin_url}")
-        print(f"Comment: {comment_text[:50]}...")
-        print(f"{'='*60}\n")
+            return error_response('comment_text is required', 400)
+        
+        done_key = prospect_key(prospect_id)
+        cached = cached_result(done_key)
+        if cached is not None:
+            logger.info(f"♻️  Already done for {prospect_id} - returning saved result")
+            return jsonify(cached), 200
+        
+        logger.debug(BANNER)
+        logger.info("💬 POST COMMENT (WARMUP)")
+        logger.debug(BANNER)
+        logger.info(f"Prospect ID: {prospect_id}")
+        logger.info(f"Profile URL: {linkedin_url}")
+        logger.info(f"Comment: {comment_text[:50]}...")
+        logger.debug(BANNER)
         
         # Get bot instance
-        bot_instance = get_bot()
+        bot_instance = pool.acquire()
+        
+        # Only claim the pacing slot once we hold a bot
+        rejected = pace_or_reject(prospect_id=prospect_id)
+        if rejected:
+            return rejected
+        paced = Config.ENFORCE_PACING
         
         # Navigate to profile
-        print(f"🌐 Navigating to profile...")
+        logger.info("🌐 Navigating to profile...")
         bot_instance.driver.get(linkedin_url)
-        from anti_detection import human_delay, scroll_slowly, human_type
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.common.action_chains import ActionChains
-        from selenium.webdriver.common.keys import Keys
         
         human_delay(5, 8)
         
         # Scroll to find posts
-        print("📜 Looking for posts...")
+        logger.info("📜 Looking for posts...")
         scroll_slowly(bot_instance.driver, 500)
         human_delay(3, 5)
         
@@ -413,11 +1191,10 @@ def comment_on_post():
         comment_success = False
         try:
             # Find comment buttons
-            comment_buttons = bot_instance.driver.find_elements(By.XPATH, 
-                "//button[contains(@aria-label, 'Comment') or contains(@class, 'comment-button')]")
+            comment_buttons = bot_instance.driver.find_elements(By.XPATH, COMMENT_BTN_XPATH)
             
             if comment_buttons and len(comment_buttons) > 0:
-                print(f"  ✅ Found {len(comment_buttons)} posts with comment buttons")
+                logger.info(f"  ✅ Found {len(comment_buttons)} posts with comment buttons")
                 
                 # Click first comment button to open comment box
                 first_button = comment_buttons[0]
@@ -425,464 +1202,153 @@ def comment_on_post():
                 # Try multiple click strategies
                 clicked = False
                 try:
-                    first_button.click()
+                    retry_with_backoff(first_button.click, RETRYABLE_CLICK_ERRORS)
                     clicked = True
-                    print(f"  ✅ Clicked comment button (normal click)")
-                except:
+                    logger.info("  ✅ Clicked comment button (normal click)")
+                except Exception:
                     try:
                         bot_instance.driver.execute_script("arguments[0].click();", first_button)
                         clicked = True
-                        print(f"  ✅ Clicked comment button (JavaScript)")
-                    except:
-                        print(f"  ❌ Could not click comment button")
+                        logger.info("  ✅ Clicked comment button (JavaScript)")
+                    except Exception:
+                        logger.error("  ❌ Could not click comment button")
                 
                 if clicked:
-                    human_delay(2, 3)
-                    
-                    # Find comment text area - try multiple selectors
-                    comment_box = None
-                    selectors = [
-                        "//div[@role='textbox' and @contenteditable='true']",
-                        "//div[contains(@class, 'ql-editor')]",
-                        "//div[@data-placeholder='Add a comment…']",
-                        "//div[contains(@class, 'comments-comment-box__form')]//div[@contenteditable='true']"
-                    ]
-                    
-                    for selector in selectors:
-                        try:
-                            boxes = bot_instance.driver.find_elements(By.XPATH, selector)
-                            # Get the last one (most recent, just opened)
-                            if boxes and len(boxes) > 0:
-                                comment_box = boxes[-1]
-                                print(f"  ✅ Found comment box (selector: {selector[:50]}...)")
-                                break
-                        except:
-                            continue
+                    # Wait for the comment text area to open - all selectors in one query
+                    ui = find_comment_ui(bot_instance.driver)
+                    comment_box = ui.get('box')
+                    if comment_box:
+                        logger.info(f"  ✅ Found comment box (selector: {ui['selector'][:50]}...)")
                     
                     if comment_box:
                         # Click to focus
-                        print(f"  🎯 Clicking comment box to focus...")
+                        logger.info("  🎯 Clicking comment box to focus...")
                         try:
-                            comment_box.click()
-                            human_delay(1, 2)
-                            print(f"  ✅ Focused on comment box")
+                            retry_with_backoff(comment_box.click, RETRYABLE_CLICK_ERRORS)
+                            logger.info("  ✅ Focused on comment box")
                         except Exception as e:
-                            print(f"  ⚠️ Click failed: {str(e)[:30]}")
+                            logger.warning(f"  ⚠️ Click failed: {str(e)[:30]}")
                         
                         # Type comment - try multiple methods for contenteditable divs
-                        print(f"  ⌨️ Typing comment...")
-                        typing_success = False
-                        
-                        # Method 1: JavaScript innerHTML (best for contenteditable)
-                        try:
-                            print(f"  📝 Method 1: JavaScript innerHTML...")
-                            # Use JavaScript to set the text
-                            script = f"arguments[0].innerHTML = '{comment_text}';"
-                            bot_instance.driver.execute_script(script, comment_box)
-                            human_delay(1, 2)
-                            
-                            # Trigger input event so LinkedIn knows text changed
-                            bot_instance.driver.execute_script(
-                                "arguments[0].dispatchEvent(new Event('input', { bubbles: true }));", 
-                                comment_box
-                            )
-                            human_delay(1, 2)
-                            
-                            # Verify text is there
-                            current_content = bot_instance.driver.execute_script("return arguments[0].innerHTML;", comment_box)
-                            if current_content and comment_text in current_content:
-                                print(f"  ✅ Comment typed successfully (JavaScript)")
-                                print(f"  📝 Content: {current_content[:50]}...")
-                                typing_success = True
-                            else:
-                                print(f"  ⚠️ JavaScript set but content not verified")
-                        except Exception as e:
-                            print(f"  ⚠️ Method 1 failed: {str(e)[:50]}")
-                        
-                        # Method 2: send_keys (backup)
-                        if not typing_success:
-                            try:
-                                print(f"  📝 Method 2: send_keys...")
-                                comment_box.send_keys(comment_text)
-                                human_delay(2, 3)
-                                
-                                # Check with JavaScript
-                                current_content = bot_instance.driver.execute_script("return arguments[0].innerHTML || arguments[0].textContent;", comment_box)
-                                if current_content and len(current_content.strip()) > 0:
-                                    print(f"  ✅ Comment typed (send_keys)")
-                                    print(f"  📝 Content: {current_content[:50]}...")
-                                    typing_success = True
-                                else:
-                                    print(f"  ⚠️ send_keys executed but no content")
-                            except Exception as e:
-                                print(f"  ⚠️ Method 2 failed: {str(e)[:50]}")
-                        
-                        # Method 3: ActionChains (for stubborn elements)
-                        if not typing_success:
-                            try:
-                                print(f"  📝 Method 3: ActionChains...")
-                                actions = ActionChains(bot_instance.driver)
-                                actions.move_to_element(comment_box).click().send_keys(comment_text).perform()
-                                human_delay(2, 3)
-                                
-                                # Check with JavaScript
-                                current_content = bot_instance.driver.execute_script("return arguments[0].innerHTML || arguments[0].textContent;", comment_box)
-                                if current_content and len(current_content.strip()) > 0:
-                                    print(f"  ✅ Comment typed (ActionChains)")
-                                    print(f"  📝 Content: {current_content[:50]}...")
-                                    typing_success = True
-                                else:
-                                    print(f"  ⚠️ ActionChains executed but no content")
-                            except Exception as e:
-                                print(f"  ⚠️ Method 3 failed: {str(e)[:50]}")
-                        
-                        # Method 4: human_type with character-by-character (last resort)
-                        if not typing_success:
-                            try:
-                                print(f"  📝 Method 4: human_type character-by-character...")
-                                # Clear first
-                                comment_box.clear()
-                                human_delay(0.5, 1)
-                                
-                                # Type slowly
-                                for char in comment_text:
-                                    comment_box.send_keys(char)
-                                    time.sleep(random.uniform(0.05, 0.15))
-                                
-                                human_delay(1, 2)
-                                
-                                # Check with JavaScript
-                                current_content = bot_instance.driver.execute_script("return arguments[0].innerHTML || arguments[0].textContent;", comment_box)
-                                if current_content and len(current_content.strip()) > 0:
-                                    print(f"  ✅ Comment typed (character-by-character)")
-                                    print(f"  📝 Content: {current_content[:50]}...")
-                                    typing_success = True
-                                else:
-                                    print(f"  ⚠️ Typed but no content detected")
-                            except Exception as e:
-                                print(f"  ⚠️ Method 4 failed: {str(e)[:50]}")
-                        
+                        logger.info("  ⌨️ Typing comment...")
                         # If typing failed completely, abort
-                        if not typing_success:
-                            print(f"  ❌ ALL TYPING METHODS FAILED")
-                            print(f"  💡 Cannot post empty comment")
+                        if not type_comment(bot_instance.driver, comment_box, comment_text):
+                            logger.error("  ❌ ALL TYPING METHODS FAILED")
+                            logger.info("  💡 Cannot post empty comment")
                             raise Exception("Failed to type comment - all methods exhausted")
                         
-                        # Now submit the comment - Ember.js-aware submission
-                        print(f"  📤 Submitting comment (Ember.js method)...")
-                        submit_success = False
-                        
-                        # First, scroll the comment box into view
-                        try:
-                            bot_instance.driver.execute_script(
-                                "arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", 
-                                comment_box
-                            )
-                            human_delay(1, 2)
-                            print(f"  ✅ Scrolled comment box into view")
-                        except Exception as e:
-                            print(f"  ⚠️ Scroll failed: {str(e)[:30]}")
-                        
-                        # Method 1: Find and trigger Ember component click
-                        try:
-                            print(f"  📝 Method 1: Ember-aware click...")
-                            
-                            # Find button using the specific class we saw in inspector
-                            buttons = bot_instance.driver.find_elements(By.XPATH, 
-                                "//button[contains(@class, 'comments-comment-box__submit-button')]")
-                            
-                            if buttons:
-                                submit_button = buttons[-1]  # Last one (most recent)
-                                
-                                # Scroll into view
-                                bot_instance.driver.execute_script(
-                                    "arguments[0].scrollIntoView({block: 'nearest'});", 
-                                    submit_button
-                                )
-                                human_delay(0.5, 1)
-                                
-                                # Trigger comprehensive click events that Ember listens for
-                                bot_instance.driver.execute_script("""
-                                    var button = arguments[0];
-                                    
-                                    // Make sure button is enabled
-                                    button.disabled = false;
-                                    button.removeAttribute('disabled');
-                                    
-                                    // Focus the button first
-                                    button.focus();
-                                    
-                                    // Create and dispatch all mouse events that Ember might listen for
-                                    var events = ['mouseenter', 'mouseover', 'mousedown', 'focus', 'mouseup', 'click'];
-                                    
-                                    events.forEach(function(eventType) {
-                                        var event = new MouseEvent(eventType, {
-                                            view: window,
-                                            bubbles: true,
-                                            cancelable: true,
-                                            buttons: 1
-                                        });
-                                        button.dispatchEvent(event);
-                                    });
-                                    
-                                    // Also trigger pointer events (modern browsers)
-                                    var pointerEvents = ['pointerdown', 'pointerup'];
-                                    pointerEvents.forEach(function(eventType) {
-                                        var event = new PointerEvent(eventType, {
-                                            view: window,
-                                            bubbles: true,
-                                            cancelable: true,
-                                            isPrimary: true
-                                        });
-                                        button.dispatchEvent(event);
-                                    });
-                                """, submit_button)
-                                
-                                human_delay(2, 3)
-                                print(f"  ✅ Triggered Ember events")
-                                submit_success = True
-                            else:
-                                print(f"  ⚠️ Submit button not found")
-                        except Exception as e:
-                            print(f"  ⚠️ Method 1 failed: {str(e)[:50]}")
-                        
-                        # Method 2: Find the Ember component and trigger its action directly
-                        if not submit_success:
-                            try:
-                                print(f"  📝 Method 2: Direct Ember action trigger...")
-                                
-                                bot_instance.driver.execute_script("""
-                                    // Find the comment box's parent form
-                                    var commentBox = arguments[0];
-                                    var form = commentBox.closest('form');
-                                    
-                                    if (form) {
-                                        // Find the submit button within this form
-                                        var submitButton = form.querySelector('button[type="submit"], button[class*="submit-button"]');
-                                        
-                                        if (submitButton) {
-                                            // Click it multiple ways
-                                            submitButton.click();
-                                            
-                                            // Try to find and trigger Ember view's click handler
-                                            if (submitButton.__ember_meta__) {
-                                                // This is an Ember component
-                                                var emberClick = new Event('click', {bubbles: true, cancelable: true});
-                                                submitButton.dispatchEvent(emberClick);
-                                            }
-                                            
-                                            // Also submit the form
-                                            if (form.onsubmit) {
-                                                form.onsubmit();
-                                            }
-                                            form.submit();
-                                        }
-                                    }
-                                """, comment_box)
-                                
-                                human_delay(2, 3)
-                                print(f"  ✅ Triggered Ember component")
-                                submit_success = True
-                            except Exception as e:
-                                print(f"  ⚠️ Method 2 failed: {str(e)[:50]}")
-                        
-                        # Method 3: Selenium ActionChains with real mouse movement
-                        if not submit_success:
-                            try:
-                                print(f"  📝 Method 3: Real mouse movement...")
-                                
-                                buttons = bot_instance.driver.find_elements(By.XPATH, 
-                                    "//button[contains(@class, 'comments-comment-box__submit-button')]")
-                                
-                                if buttons:
-                                    submit_button = buttons[-1]
-                                    
-                                    # Scroll into view
-                                    bot_instance.driver.execute_script(
-                                        "arguments[0].scrollIntoView({block: 'center'});", 
-                                        submit_button
-                                    )
-                                    human_delay(1, 2)
-                                    
-                                    # Use ActionChains for human-like interaction
-                                    actions = ActionChains(bot_instance.driver)
-                                    
-                                    # Move to button
-                                    actions.move_to_element(submit_button)
-                                    actions.pause(0.5)
-                                    
-                                    # Click and hold briefly (more human-like)
-                                    actions.click_and_hold()
-                                    actions.pause(0.1)
-                                    actions.release()
-                                    
-                                    # Execute the chain
-                                    actions.perform()
-                                    
-                                    human_delay(2, 3)
-                                    print(f"  ✅ Clicked with ActionChains")
-                                    submit_success = True
-                            except Exception as e:
-                                print(f"  ⚠️ Method 3 failed: {str(e)[:50]}")
+                        # Now submit the comment - click, then wait for the box to clear,
+                        # all in one browser round-trip
+                        logger.info("  📤 Submitting comment...")
+                        if Config.HUMAN_LIKE:
+                            human_delay(1, 2)  # Re-read the comment before posting
                         
-                        # Method 4: Tab to button and press Space/Enter
-                        if not submit_success:
-                            try:
-                                print(f"  📝 Method 4: Keyboard navigation...")
-                                
-                                # Press Tab to move focus from comment box to button
-                                comment_box.send_keys(Keys.TAB)
-                                human_delay(0.5, 1)
-                                
-                                # Get the currently focused element
-                                focused = bot_instance.driver.switch_to.active_element
-                                
-                                # Press Space (activates buttons in HTML)
-                                focused.send_keys(Keys.SPACE)
-                                human_delay(1, 2)
-                                
-                                print(f"  ✅ Pressed Tab + Space")
-                                submit_success = True
-                            except Exception as e:
-                                print(f"  ⚠️ Method 4 failed: {str(e)[:50]}")
+                        submitted = True
+                        comment_success = wait_comment_posted(
+                            bot_instance.driver, comment_box, comment_text, click=True
+                        )
                         
-                        # Method 5: Enter key (last resort)
-                        if not submit_success:
+                        # Last resort: Enter key
+                        if not comment_success:
+                            logger.warning("  ⚠️ Click didn't post the comment - trying Enter key...")
                             try:
-                                print(f"  📝 Method 5: Enter key...")
                                 comment_box.send_keys(Keys.RETURN)
-                                human_delay(2, 3)
-                                print(f"  ✅ Pressed Enter")
-                                submit_success = True
+                                comment_success = wait_comment_posted(
+                                    bot_instance.driver, comment_box, comment_text
+                                )
+                            except StaleElementReferenceException:
+                                comment_success = True  # Box went away - posted
                             except Exception as e:
-                                print(f"  ⚠️ Method 5 failed: {str(e)[:50]}")
+                                logger.warning(f"  ⚠️ Enter key failed: {str(e)[:50]}")
                         
-                        if submit_success:
-                            human_delay(3, 5)
-                                
-                        if submit_success:
-                            human_delay(3, 5)
-                            
-                            # Verify comment was posted
-                            print(f"  🔍 Verifying comment was posted...")
-                            try:
-                                # Check if text was cleared from comment box
-                                try:
-                                    current_content = bot_instance.driver.execute_script(
-                                        "return arguments[0].innerHTML || arguments[0].textContent || '';", 
-                                        comment_box
-                                    )
-                                    current_text = current_content.strip()
-                                    
-                                    if len(current_text) == 0:
-                                        print(f"  ✅ VERIFIED: Comment box is now empty!")
-                                        comment_success = True
-                                    elif comment_text.strip() not in current_text:
-                                        print(f"  ✅ VERIFIED: Our comment text is gone!")
-                                        comment_success = True
-                                    else:
-                                        print(f"  ⚠️ Text still in box after Enter")
-                                        print(f"  📝 Box content: '{current_text[:50]}...'")
-                                        # Could still be a timing issue - wait a bit more
-                                        human_delay(2, 3)
-                                        # Check again
-                                        current_content = bot_instance.driver.execute_script(
-                                            "return arguments[0].innerHTML || arguments[0].textContent || '';", 
-                                            comment_box
-                                        )
-                                        current_text = current_content.strip()
-                                        if len(current_text) == 0 or comment_text.strip() not in current_text:
-                                            print(f"  ✅ VERIFIED: Comment cleared (slight delay)")
-                                            comment_success = True
-                                        else:
-                                            print(f"  ❌ FAILED: Text still there after retry")
-                                            comment_success = False
-                                except:
-                                    # If we can't access the box, it probably closed (success)
-                                    print(f"  ✅ VERIFIED: Comment box no longer accessible (posted!)")
-                                    comment_success = True
-                                    
-                            except Exception as e:
-                                print(f"  ⚠️ Could not verify: {str(e)[:50]}")
-                                # If we can't verify, be conservative and assume failure
-                                comment_success = False
-                            
-                            if comment_success:
-                                print(f"  🎉 COMMENT POSTED SUCCESSFULLY!")
-                            else:
-                                print(f"  ❌ COMMENT FAILED TO POST!")
+                        if comment_success:
+                            logger.info("  🎉 COMMENT POSTED SUCCESSFULLY!")
                         else:
-                            print(f"  ❌ Failed to submit comment (Enter key didn't work)")
+                            logger.error("  ❌ COMMENT FAILED TO POST!")
                     else:
-                        print(f"  ❌ Could not find comment text box")
+                        logger.error("  ❌ Could not find comment text box")
             else:
-                print("  ⚠️ No posts found with comment buttons")
+                logger.warning("  ⚠️ No posts found with comment buttons")
                 
         except Exception as e:
-            print(f"  ❌ Error in comment flow: {str(e)[:100]}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"  ❌ Error in comment flow: {str(e)[:100]}")
         
-        return jsonify({
+        result = {
             'success': comment_success,
             'action_taken': 'post_comment',
             'comment_success': comment_success,
             'comment_text': comment_text if comment_success else '',
             'profile_url': linkedin_url,
             'prospect_id': prospect_id,
-            'timestamp': datetime.now().isoformat()
-        }), 200 if comment_success else 500
+            'timestamp': g.ts
+        }
+        if comment_success:
+            remember_result(done_key, result)
+            return jsonify(result), 200
+        # Refund only if the comment was never submitted
+        if paced and not submitted:
+            pacer.refund()
+        return jsonify(result), 500
         
     except Exception as e:
         error_msg = str(e)
-        print(f"\n❌ ERROR: {error_msg}\n")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"❌ ERROR: {error_msg}")
+        if paced and not submitted:
+            pacer.refund()
+        recreate = discard_if_session_error(bot_instance, error_msg)
         
-        return jsonify({
-            'success': False,
-            'error': error_msg,
-            'prospect_id': data.get('prospect_id') if data else None,
-            'timestamp': datetime.now().isoformat()
-        }), 500
+        return error_response(
+            error_msg,
+            prospect_id=data.get('prospect_id') if data else None,
+            timestamp=g.ts
+        )
+    finally:
+        if bot_instance is not None:
+            pool.release(bot_instance)
+        if recreate:
+            start_warmup()
 
 @app.route('/close', methods=['POST'])
 def close_bot():
-    """Close the bot and browser"""
-    global bot
+    """Close all bots and browsers"""
     try:
-        if bot:
-            bot.close()
-            bot = None
+        pool.close_all()
         return jsonify({
             'success': True,
             'message': 'Bot closed'
         })
     except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        return error_response(str(e))
 
 if __name__ == '__main__':
     # Validate configuration
     try:
         Config.validate()
-        print("\n" + "="*60)
-        print("🚀 LINKEDIN BOT API SERVER")
-        print("="*60)
-        print(f"Email: {Config.LINKEDIN_EMAIL}")
-        print(f"Headless: {Config.HEADLESS}")
-        print(f"Port: {Config.PORT}")
-        print(f"Max Daily Connections: {Config.MAX_DAILY_CONNECTIONS}")
-        print("="*60 + "\n")
-        
-        # Start Flask server
+        logger.debug(BANNER)
+        logger.info("🚀 LINKEDIN BOT API SERVER")
+        logger.debug(BANNER)
+        logger.info(f"Email: {Config.LINKEDIN_EMAIL}")
+        logger.info(f"Headless: {Config.HEADLESS}")
+        logger.info(f"Port: {Config.PORT}")
+        logger.info(f"Max Daily Connections: {Config.MAX_DAILY_CONNECTIONS}")
+        logger.debug(BANNER)
+        
+        # Launch Chrome and log in before the first request arrives
+        start_warmup()
+        
+        # Don't leave Chrome/chromedriver processes behind on exit
+        # (gunicorn does this in its worker_exit hook)
+        atexit.register(pool.close_all)
+        
+        # Start Flask dev server (threaded so /health isn't blocked by a
+        # running LinkedIn action). In production use gunicorn instead:
+        #   gunicorn -c gunicorn.conf.py app:app
         app.run(
             host='0.0.0.0',
             port=Config.PORT,
-            debug=False  # Set to False in production
+            debug=False,  # Set to False in production
+            threaded=True
         )
     except ValueError as e:
-        print(f"\n❌ Configuration Error: {e}")
-        print("Please check your .env file\n")
\ No newline at end of file
+        logger.error(f"❌ Configuration Error: {e}")
+        logger.info("Please check your .env file")
\ No newline at end of file
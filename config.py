@@ -16,11 +16,41 @@ class Config:
     PORT = int(os.getenv('PORT', 5000))
     USE_CHROME_PROFILE = os.getenv('USE_CHROME_PROFILE', 'false').lower() == 'true'
     
+    # Number of warm Chrome sessions (each needs its own logged-in profile)
+    BOT_POOL_SIZE = int(os.getenv('BOT_POOL_SIZE', 1))
+    
+    # /login returns the cached state if the last verified login is this recent
+    LOGIN_CACHE_MINUTES = int(os.getenv('LOGIN_CACHE_MINUTES', 30))
+    
+    # Retried requests for an already-completed action get the saved result
+    IDEMPOTENCY_TTL_MINUTES = int(os.getenv('IDEMPOTENCY_TTL_MINUTES', 60))
+    
+    # Skip get_bot()'s browser liveness probe if the session was used this recently
+    SESSION_CHECK_TTL = float(os.getenv('SESSION_CHECK_TTL', 5))
+    
+    # Page Load Settings
+    PAGE_LOAD_STRATEGY = os.getenv('PAGE_LOAD_STRATEGY', 'eager')  # 'normal', 'eager' or 'none'
+    DISABLE_IMAGES = os.getenv('DISABLE_IMAGES', 'false').lower() == 'true'
+    
+    # Block images, fonts and trackers (CDP) while a connection request runs
+    BLOCK_RESOURCES = os.getenv('BLOCK_RESOURCES', 'false').lower() == 'true'
+    
     # Safety Settings
     MAX_DAILY_CONNECTIONS = int(os.getenv('MAX_DAILY_CONNECTIONS', 30))
     MIN_DELAY_SECONDS = int(os.getenv('MIN_DELAY_SECONDS', 120))
     MAX_DELAY_SECONDS = int(os.getenv('MAX_DELAY_SECONDS', 300))
     
+    # Answer 429 + Retry-After to connection requests / comments that arrive
+    # less than MIN..MAX_DELAY_SECONDS after the previous one
+    ENFORCE_PACING = os.getenv('ENFORCE_PACING', 'false').lower() == 'true'
+    
+    # Pause like a person at key points inside an action (false = only the
+    # pacing between actions; faster, but less human-looking)
+    HUMAN_LIKE = os.getenv('HUMAN_LIKE', 'true').lower() == 'true'
+    
+    # Total human-delay budget for a single connection request (seconds)
+    REQUEST_DELAY_BUDGET = float(os.getenv('REQUEST_DELAY_BUDGET', 60))
+    
     @classmethod
     def validate(cls):
         """Validate that required config is set"""
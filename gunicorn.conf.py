@@ -0,0 +1,47 @@
+"""
+Gunicorn configuration for the LinkedIn Bot API
+
+Usage:
+    gunicorn -c gunicorn.conf.py app:app
+
+A single worker process owns the bot pool. It runs one thread per pooled
+Chrome session plus two spare, so /health and /login still answer while
+every bot is busy.
+"""
+import os
+from config import Config
+
+bind = f"0.0.0.0:{os.getenv('PORT', 5000)}"
+
+# The bot pool lives in this one process - extra workers would each
+# launch their own Chromes on the same profiles. Scale with BOT_POOL_SIZE.
+workers = 1
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', Config.BOT_POOL_SIZE + 2))
+
+# LinkedIn actions (with human delays) can take minutes
+timeout = int(os.getenv('GUNICORN_TIMEOUT', 600))
+graceful_timeout = 30
+
+
+def on_starting(server):
+    """Check the configuration once, in the master, before forking"""
+    Config.validate()
+
+
+def worker_int(worker):
+    """Cut short any human delays so the worker can exit promptly"""
+    from anti_detection import stop_delays
+    stop_delays()
+
+
+def post_worker_init(worker):
+    """Launch Chrome and log in before the first request arrives"""
+    from app import start_warmup
+    start_warmup()
+
+
+def worker_exit(server, worker):
+    """Quit every pooled Chrome and chromedriver before the worker goes away"""
+    from app import pool
+    pool.close_all()
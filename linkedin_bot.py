@@ -6,29 +6,548 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
+import logging
 import time
 import json
 import os
+import functools
 import platform
+import threading
 from config import Config
 from anti_detection import human_delay, human_type, scroll_slowly
 
+logger = logging.getLogger(__name__)
+
+# Any Connect button on the page; callers filter by position so the
+# sidebar's "More profiles for you" buttons are skipped
+VISIBLE_CONNECT_SELECTORS = (
+    # Simple text match - finds all Connect buttons
+    "//button[normalize-space(.)='Connect']",
+    
+    # Aria label version
+    "button[aria-label*='Invite'][aria-label*='to connect']",
+    
+    # With span child
+    "//button[.//span[normalize-space()='Connect']]",
+    
+    # Connect button that's a sibling of Message
+    "//button[normalize-space(.)='Message']/following-sibling::button[normalize-space(.)='Connect']",
+)
+
+# The "More" button in the PROFILE ACTIONS area - NOT the "More actions"
+# button in the top navigation bar! Profile actions are usually in a
+# section with Message/Follow buttons
+MORE_BUTTON_XPATHS = (
+    # Simple: just find the More button in main content (not navigation)
+    "//main//button[normalize-space(.)='More']",
+    # Try finding it near Message/Follow buttons (profile actions)
+    "//section[contains(@class, 'pv-top-card')]//button[normalize-space(.)='More']",
+    # Look for More button that's AFTER Message button (in same container)
+    "//button[contains(., 'Message')]/following-sibling::button[contains(., 'More')]",
+    # More specific: Find Message button, go to parent, find More
+    "//button[contains(@aria-label, 'Message')]/parent::*/button[contains(., 'More')]",
+    # Last resort: any button with just text "More"
+    "//button[text()='More' or .//span[text()='More']]",
+)
+
+# Connect inside the More dropdown, relative to the menu that just opened
+DROPDOWN_CONNECT_XPATHS = (
+    ".//span[text()='Connect']",
+    ".//div[text()='Connect']",
+    # Try the clickable parent
+    ".//span[text()='Connect']/..",
+)
+
+# Page-wide Connect lookups, only tried once the menu has had its full
+# DROPDOWN_TIMEOUT_MS (they also match e.g. the sidebar's Connect buttons)
+DROPDOWN_CONNECT_FALLBACK_XPATHS = (
+    # Try even broader - any currently visible dropdown
+    "//div[contains(@class, 'artdeco-dropdown') and not(contains(@class, 'ember-view'))]//span[text()='Connect']",
+    # Last resort: just find any Connect that's visible
+    "//span[text()='Connect' and not(ancestor::*[contains(@style, 'display: none')])]",
+)
+
+# A connection request to this person is already pending
+PENDING_SELECTORS = (
+    "//button[contains(., 'Pending') or contains(@aria-label, 'Pending')]",
+    "button[aria-label*='withdraw']",
+)
+
+# Already following this person
+FOLLOWING_XPATHS = (
+    "//button[contains(., 'Following') or contains(@aria-label, 'Following')]",
+)
+
+# Follow button (creator/influencer profiles)
+FOLLOW_SELECTORS = (
+    "//button[.//span[text()='Follow']]",
+    "button[aria-label*='Follow']",
+    "//button[contains(., 'Follow') and not(contains(., 'Following'))]",
+)
+
+# Message button with no Connect/Follow/Pending next to it = already connected
+CONNECTED_CHECK_XPATHS = {
+    'message': "//button[normalize-space(.)='Message']",
+    'connect': "//button[normalize-space(.)='Connect']",
+    'follow': "//button[normalize-space(.)='Follow' or normalize-space(.)='Following']",
+    'pending': "//button[contains(., 'Pending')]",
+}
+
+# "Add a note" button in the invitation modal
+ADD_NOTE_SELECTORS = (
+    "//button[contains(text(), 'Add a note')]",
+    "button[aria-label='Add a note']",
+    "button[class*='add-note']",
+    "//button[.//span[contains(text(), 'Add a note')]]",
+    "//a[contains(text(), 'Add a note')]",  # Sometimes it's a link
+)
+
+# Invitation modal areas that expand the note field when clicked
+NOTE_CONTAINER_SELECTORS = (
+    "div[class*='send-invite']",
+    "div[class*='invitation-modal']",
+    "//div[contains(text(), 'Add a note')]",
+)
+
+# The connection note text area
+NOTE_TEXTAREA_SELECTORS = (
+    "textarea#custom-message",
+    "textarea[name='message']",
+    "textarea[placeholder*='Add a note']",
+    "textarea[class*='send-invite__custom-message']",
+    "textarea[aria-label*='Add a note']",
+    "div[role='textbox']",  # Sometimes it's a contenteditable div
+)
+
+# Send button once a note was added
+SEND_WITH_NOTE_SELECTORS = (
+    "button[aria-label*='Send']:not([aria-label*='without'])",
+    "button[aria-label='Send invitation']",
+    "//button[.//span[text()='Send']]",
+    "//button[contains(., 'Send now')]",
+    "//button[text()='Send']",
+)
+
+# Send button when no note was added: "Send without a note" OR just "Send"
+SEND_WITHOUT_NOTE_SELECTORS = (
+    "//button[contains(., 'Send without a note')]",
+    "button[aria-label*='Send without']",
+    "//button[.//span[contains(text(), 'Send')]]",
+    "button[aria-label*='Send']",
+    "//button[text()='Send']",
+)
+
+# The invitation modal (still visible after Send = not sent yet)
+INVITE_MODAL_SELECTORS = (
+    "div[class*='send-invite'], div[class*='artdeco-modal']",
+)
+
+# Any of these means the profile's action buttons have rendered
+PROFILE_ACTIONS_READY = (
+    (By.CSS_SELECTOR, "button[class*='pvs-profile-actions']"),
+    (By.XPATH, "//main//button[normalize-space(.)='More']"),
+    (By.XPATH, "//main//button[.//span[text()='Connect']]"),
+)
+
+# firstVisible(selectors, maxX, maxY, excludeText, root): the first element
+# matched by any of the selectors (tried in order; XPath or CSS, see
+# selector_locator) that is rendered, enabled, inside the optional
+# page-coordinate limits and whose text/aria-label doesn't contain
+# excludeText - plus the index of the selector that found it. Relative
+# selectors are evaluated against root (default: the document)
+_FIRST_VISIBLE_FN = """
+    // XPath if it starts with '/', '(' or './', CSS otherwise; document order
+    function matches(selector, root) {
+        root = root || document;
+        if (/^(\\/|\\(|\\.\\/)/.test(selector)) {
+            var hits = document.evaluate(selector, root, null,
+                XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null), nodes = [];
+            for (var k = 0; k < hits.snapshotLength; k++) nodes.push(hits.snapshotItem(k));
+            return nodes;
+        }
+        return root.querySelectorAll(selector);
+    }
+
+    function shown(el) {
+        return el.getClientRects().length > 0 &&
+               getComputedStyle(el).visibility !== 'hidden';
+    }
+
+    function firstVisible(selectors, maxX, maxY, excludeText, root) {
+        for (var i = 0; i < selectors.length; i++) {
+            var hits = matches(selectors[i], root);
+            for (var j = 0; j < hits.length; j++) {
+                var el = hits[j];
+                if (!shown(el) || el.disabled) continue;
+                var rect = el.getBoundingClientRect();
+                if (maxX != null && rect.left + window.pageXOffset > maxX) continue;
+                if (maxY != null && rect.top + window.pageYOffset > maxY) continue;
+                if (excludeText) {
+                    var label = (el.innerText || '') + ' ' + (el.getAttribute('aria-label') || '');
+                    if (label.toLowerCase().indexOf(excludeText) !== -1) continue;
+                }
+                return {element: el, index: i};
+            }
+        }
+        return null;
+    }
+"""
+
+# Probe a whole selector list in one WebDriver round-trip
+FIND_FIRST_VISIBLE_JS = _FIRST_VISIBLE_FN + """
+    return firstVisible(arguments[0], arguments[1], arguments[2], arguments[3]);
+"""
+
+# One pass over the profile's action buttons: existing relationship (pending /
+# following / connected) and the visible Connect, More and Follow buttons.
+# Pending and following come back as the matching button's label
+CLASSIFY_PROFILE_JS = _FIRST_VISIBLE_FN + """
+    var x = arguments[0];
+
+    function shownMatch(selectors) {
+        for (var i = 0; i < selectors.length; i++) {
+            var hits = matches(selectors[i]);
+            for (var j = 0; j < hits.length; j++) {
+                if (shown(hits[j])) return hits[j];
+            }
+        }
+        return null;
+    }
+
+    function label(el) {
+        return el ? (el.innerText || el.getAttribute('aria-label') || '').trim() : null;
+    }
+
+    var c = x.connected;
+    return {
+        pending: label(shownMatch(x.pending)),
+        following: label(shownMatch(x.following)),
+        connected: !!shownMatch([c.message]) && !shownMatch([c.connect]) &&
+                   !shownMatch([c.follow]) && !shownMatch([c.pending]),
+        connect: firstVisible(x.visibleConnect, 1000, 700),
+        more: firstVisible(x.more, null, null, 'actions'),
+        follow: firstVisible(x.follow)
+    };
+"""
+
+# After a native click on a menu trigger, wait (MutationObserver, re-checked
+# at most once per frame) until the trigger's menu is open - aria-expanded or
+# an is-open dropdown - and one of the arguments[1] selectors shows up inside
+# it. Only when arguments[3] ms pass without that are the page-wide
+# arguments[2] selectors tried (their index continues after arguments[1]).
+# Resolves with firstVisible()'s result, or null
+WAIT_MENU_OPTION_JS = _FIRST_VISIBLE_FN + """
+    var trigger = arguments[0], inMenu = arguments[1], fallback = arguments[2];
+    var timeout = arguments[3];
+    var done = arguments[arguments.length - 1];
+
+    function openMenu() {
+        var dropdown = trigger.closest('.artdeco-dropdown');
+        var menu = dropdown && dropdown.querySelector('.artdeco-dropdown__content.is-open');
+        if (!menu && trigger.getAttribute('aria-expanded') === 'true') {
+            var id = trigger.getAttribute('aria-controls');
+            menu = (id && document.getElementById(id)) ||
+                   (dropdown && dropdown.querySelector('.artdeco-dropdown__content'));
+        }
+        menu = menu || document.querySelector('div.artdeco-dropdown__content.is-open');
+        return menu && shown(menu) ? menu : null;
+    }
+
+    function find() {
+        var menu = openMenu();
+        return menu ? firstVisible(inMenu, null, null, null, menu) : null;
+    }
+
+    var found = find();
+    if (found) {
+        done(found);
+        return;
+    }
+
+    var pending = false, timer;
+    var observer = new MutationObserver(function () {
+        if (pending) return;
+        pending = true;
+        requestAnimationFrame(function () {
+            pending = false;
+            var f = find();
+            if (f) {
+                observer.disconnect();
+                clearTimeout(timer);
+                done(f);
+            }
+        });
+    });
+    observer.observe(document.body, {
+        childList: true, subtree: true,
+        attributes: true, attributeFilter: ['class', 'style', 'aria-expanded', 'aria-hidden']
+    });
+    timer = setTimeout(function () {
+        observer.disconnect();
+        var f = find();
+        if (!f) {
+            f = firstVisible(fallback);
+            if (f) f.index += inMenu.length;
+        }
+        done(f);
+    }, timeout);
+"""
+
+# How long to wait for the More dropdown to render its options
+DROPDOWN_TIMEOUT_MS = 5000
+
+# Debug dump of on-page labels: text (or aria-label) of the first `limit`
+# elements matching a CSS selector, gathered in one round-trip
+ELEMENT_LABELS_JS = """
+    var nodes = document.querySelectorAll(arguments[0]), labels = [];
+    for (var i = 0; i < nodes.length && labels.length < arguments[1]; i++) {
+        var label = (nodes[i].innerText || nodes[i].getAttribute('aria-label') || '').trim();
+        if (label) labels.push(label);
+    }
+    return [nodes.length, labels];
+"""
+
+# Requests that don't matter for the profile action bar (BLOCK_RESOURCES)
+BLOCKED_URL_PATTERNS = (
+    '*.jpg', '*.jpeg', '*.png', '*.webp', '*.gif',
+    '*.woff2', '*.woff',
+    '*/ads/*', '*googletagmanager.com/*', '*linkedin.com/li/track*', '*doubleclick.net/*',
+)
+
+# Where to send ChromeDriver's log output
+DEVNULL_PATH = 'NUL' if platform.system() == 'Windows' else '/dev/null'
+
+# Put text arguments[1] into note field arguments[0] (textarea or
+# contenteditable div) and fire the input event the page listens for. The
+# native value setter is used so framework value tracking sees the change
+SET_NOTE_TEXT_JS = """
+    var field = arguments[0], text = arguments[1];
+    field.focus();
+    if (field.tagName === 'TEXTAREA') {
+        Object.getOwnPropertyDescriptor(HTMLTextAreaElement.prototype, 'value')
+              .set.call(field, text);
+    } else {
+        field.textContent = text;
+    }
+    field.dispatchEvent(new Event('input', {bubbles: true}));
+"""
+
+# Poll interval for explicit waits (Selenium's default is 0.5s)
+WAIT_POLL_SECONDS = 0.1
+
+# Silence webdriver-manager's own console logging
+os.environ.setdefault('WDM_LOG', '0')
+
+# ChromeDriver binary resolved by webdriver-manager (see chromedriver_path)
+_driver_path = None
+_driver_path_lock = threading.Lock()
+
+def chromedriver_path():
+    """
+    Path to the ChromeDriver binary, resolved once per process
+    
+    ChromeDriverManager().install() checks the installed Chrome and the
+    driver release over HTTP every time it is called, so the result is
+    reused for every bot. It is only resolved again if the cached binary
+    disappears from disk.
+    
+    Returns:
+        str: Filesystem path to chromedriver
+    """
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path is None or not os.path.isfile(_driver_path):
+            _driver_path = ChromeDriverManager().install()
+        return _driver_path
+
+def selector_locator(selector):
+    """
+    Selenium locator for a selector from the *_SELECTORS lists
+    
+    Entries starting with '/', '(' or './' are XPath, everything else is CSS
+    (which the browser matches faster - used wherever no text match is needed).
+    
+    Args:
+        selector: XPath or CSS selector string
+        
+    Returns:
+        tuple: (By.XPATH or By.CSS_SELECTOR, selector)
+    """
+    if selector.startswith(('/', '(', './')):
+        return By.XPATH, selector
+    return By.CSS_SELECTOR, selector
+
+def to_cdp_cookie(cookie):
+    """
+    Convert a cookie saved from driver.get_cookies() to a CDP Network.CookieParam
+    
+    Args:
+        cookie: Selenium cookie dict
+        
+    Returns:
+        dict: Cookie accepted by Network.setCookies
+    """
+    param = {
+        'name': cookie['name'],
+        'value': cookie['value'],
+        'domain': cookie.get('domain', '.linkedin.com'),
+        'path': cookie.get('path', '/'),
+        'secure': cookie.get('secure', False),
+        'httpOnly': cookie.get('httpOnly', False),
+    }
+    if cookie.get('sameSite') in ('Strict', 'Lax', 'None'):
+        param['sameSite'] = cookie['sameSite']
+    if 'expiry' in cookie:
+        param['expires'] = int(cookie['expiry'])
+    return param
+
+@functools.lru_cache(maxsize=4)
+def read_cdp_cookies(path, mtime):
+    """
+    Read a cookie file saved by save_cookies(), converted with to_cdp_cookie()
+    
+    Cached per (path, mtime), so pool slots share one parse and a re-saved
+    file is picked up automatically.
+    
+    Args:
+        path: Cookie file path
+        mtime: os.path.getmtime(path), part of the cache key
+        
+    Returns:
+        tuple: CDP cookie dicts (shared - don't modify)
+    """
+    with open(path, 'r') as f:
+        return tuple(to_cdp_cookie(cookie) for cookie in json.load(f))
+
+class _AttachedRemote(RemoteWebDriver):
+    """
+    Remote WebDriver that adopts an existing session instead of starting one
+    
+    Talks to chromedriver through a ChromiumRemoteConnection, so the
+    Chrome-only commands (execute_cdp_cmd) keep working after a reattach.
+    """
+    
+    def __init__(self, session_id, executor_url):
+        self._attach_session_id = session_id
+        executor = ChromiumRemoteConnection(
+            remote_server_addr=executor_url,
+            vendor_prefix='goog',
+            browser_name='chrome',
+            keep_alive=True
+        )
+        super().__init__(command_executor=executor, options=webdriver.ChromeOptions())
+    
+    def start_session(self, capabilities):
+        self.session_id = self._attach_session_id
+        self.caps = {}
+    
+    def execute_cdp_cmd(self, cmd, cmd_args):
+        """Same as webdriver.Chrome.execute_cdp_cmd()"""
+        return self.execute('executeCdpCommand', {'cmd': cmd, 'params': cmd_args})['value']
+
 class LinkedInBot:
-    """LinkedIn automation bot using Selenium with cookie-based authentication"""
+    """
+    LinkedIn automation bot using Selenium with cookie-based authentication
+    
+    Meant to be long-lived: create one bot (or one per BotPool slot) and run
+    every profile through it. Each action navigates to its own page, so no
+    per-profile reset is needed - launching Chrome per profile only adds
+    startup time and another login check.
+    """
     
-    def __init__(self):
-        """Initialize the bot with Chrome WebDriver"""
-        self.driver = None
+    def __init__(self, driver=None, service=None, slot=0):
+        """
+        Initialize the bot with Chrome WebDriver
+        
+        Args:
+            driver: Existing WebDriver to adopt (skips launching Chrome)
+            service: ChromeDriver service that owns an adopted driver
+            slot: Pool slot; each slot gets its own Chrome profile,
+                  debugging port and session file
+        """
+        self.driver = driver
+        self.slot = slot
+        self.session_file = self.session_file_for(slot)
         self.logged_in = False
+        self.last_login_ts = None  # time.time() of last verified login
+        self.last_verified = 0.0  # time.monotonic() the session was last known alive
+        self.action_clicked = False  # Connect/Follow clicked in the last send_connection_request()
         self.cookies_file = 'linkedin_cookies.json'
-        self._init_driver()
+        self._service = service
+        self._waits = {}  # timeout -> WebDriverWait, see _wait()
+        if self.driver is None:
+            self._init_driver()
+    
+    def _wait(self, timeout):
+        """
+        WebDriverWait for this bot's driver, reused per timeout
+        
+        Polls every WAIT_POLL_SECONDS instead of Selenium's default 0.5s,
+        so an element is picked up soon after it appears.
+        
+        Args:
+            timeout: Seconds to wait before TimeoutException
+        """
+        wait = self._waits.get(timeout)
+        if wait is None:
+            wait = WebDriverWait(self.driver, timeout, poll_frequency=WAIT_POLL_SECONDS)
+            self._waits[timeout] = wait
+        return wait
+    
+    @staticmethod
+    def session_file_for(slot):
+        """Session file used by the given pool slot"""
+        return 'linkedin_session.json' if slot == 0 else f'linkedin_session_{slot}.json'
+    
+    @classmethod
+    def reattach(cls, slot=0, service=None):
+        """
+        Reattach to the chromedriver session saved by save_session()
+        
+        Much cheaper than launching Chrome and logging in again when only
+        the Python side lost its connection to a still-running browser.
+        
+        Args:
+            slot: Pool slot whose saved session to adopt
+            service: ChromeDriver service to keep alive for the adopted session
+            
+        Returns:
+            LinkedInBot if the saved session is still alive, None otherwise
+        """
+        session_file = cls.session_file_for(slot)
+        if not os.path.exists(session_file):
+            return None
+        
+        try:
+            with open(session_file, 'r') as f:
+                session = json.load(f)
+            
+            driver = _AttachedRemote(session['session_id'], session['executor_url'])
+            # Make sure the session really is alive
+            _ = driver.current_url
+        except Exception as e:
+            logger.warning(f"⚠️  Could not reattach to saved session: {str(e)[:50]}")
+            return None
+        
+        logger.info(f"♻️  Reattached to existing browser session {session['session_id'][:8]}...")
+        bot = cls(driver=driver, service=service, slot=slot)
+        # Sessions are only saved after a successful login
+        bot.logged_in = True
+        return bot
+    
+    def save_session(self):
+        """Save the WebDriver session id so it can be reattached later"""
+        with open(self.session_file, 'w') as f:
+            json.dump({
+                'session_id': self.driver.session_id,
+                'executor_url': self.driver.command_executor._url
+            }, f)
         
     def _init_driver(self):
         """Initialize Chrome WebDriver with anti-detection settings"""
-        print("🚀 Initializing Chrome WebDriver...")
-        
-        # Import platform at function level
-        import platform
+        logger.info("🚀 Initializing Chrome WebDriver...")
         
         options = webdriver.ChromeOptions()
         
@@ -36,28 +555,30 @@ class LinkedInBot:
         # This ensures cookies persist between sessions
         if not Config.HEADLESS:
             # Create a persistent profile directory for the bot
-            bot_profile_dir = os.path.join(os.getcwd(), 'chrome_bot_profile')
+            # (Chrome locks a profile, so every pool slot needs its own)
+            profile_name = 'chrome_bot_profile' if self.slot == 0 else f'chrome_bot_profile_{self.slot}'
+            bot_profile_dir = os.path.join(os.getcwd(), profile_name)
             
             # Create directory if it doesn't exist
             if not os.path.exists(bot_profile_dir):
                 os.makedirs(bot_profile_dir)
-                print(f"📁 Created persistent Chrome profile: {bot_profile_dir}")
+                logger.info(f"📁 Created persistent Chrome profile: {bot_profile_dir}")
             else:
-                print(f"📂 Using persistent Chrome profile: {bot_profile_dir}")
+                logger.info(f"📂 Using persistent Chrome profile: {bot_profile_dir}")
             
             # Use this persistent profile
             options.add_argument(f"user-data-dir={bot_profile_dir}")
             
-            print("✅ Cookies will persist between sessions!")
+            logger.info("✅ Cookies will persist between sessions!")
         else:
-            print("📂 Using temporary Chrome profile (headless mode)")
+            logger.info("📂 Using temporary Chrome profile (headless mode)")
         
         # Headless mode (no visible browser window)
         if Config.HEADLESS:
             options.add_argument('--headless')
-            print("👻 Running in headless mode (no browser window)")
+            logger.info("👻 Running in headless mode (no browser window)")
         else:
-            print("👀 Running with visible browser window")
+            logger.info("👀 Running with visible browser window")
         
         # Anti-detection settings
         options.add_argument('--no-sandbox')
@@ -67,7 +588,7 @@ class LinkedInBot:
         options.add_experimental_option('useAutomationExtension', False)
         
         # Fix for DevToolsActivePort error (Windows)
-        options.add_argument('--remote-debugging-port=9222')
+        options.add_argument(f'--remote-debugging-port={9222 + self.slot}')
         options.add_argument('--disable-gpu')
         options.add_argument('--disable-software-rasterizer')
         
@@ -80,8 +601,17 @@ class LinkedInBot:
         options.add_argument('--disable-features=TranslateUI')
         options.add_argument('--disable-features=BlinkGenPropertyTrees')
         
-        # Page loading strategy - don't wait for all resources
-        options.page_load_strategy = 'normal'  # or 'eager' for faster loads
+        # Page loading strategy - 'eager' returns at DOMContentLoaded
+        # instead of waiting for every image/tracker to finish
+        options.page_load_strategy = Config.PAGE_LOAD_STRATEGY
+        
+        # Skip image downloads (profile pages are mostly image bytes)
+        if Config.DISABLE_IMAGES:
+            options.add_argument('--blink-settings=imagesEnabled=false')
+            options.add_experimental_option('prefs', {
+                'profile.managed_default_content_settings.images': 2
+            })
+            logger.info("🖼️  Images disabled for faster page loads")
         
         # Set realistic window size
         options.add_argument('--window-size=1920,1080')
@@ -90,18 +620,27 @@ class LinkedInBot:
         options.add_experimental_option('excludeSwitches', ['enable-logging'])
         
         # Use webdriver-manager to auto-download correct ChromeDriver
-        service = Service(ChromeDriverManager().install())
+        service = Service(chromedriver_path())
         
         # Suppress ChromeDriver logs
-        service.log_path = 'NUL' if platform.system() == 'Windows' else '/dev/null'
+        service.log_path = DEVNULL_PATH
         
-        self.driver = webdriver.Chrome(service=service, options=options)
+        # Reuse one HTTP connection to chromedriver for every command
+        self.driver = webdriver.Chrome(service=service, options=options, keep_alive=True)
+        if not getattr(self.driver.command_executor, 'keep_alive', False):
+            logger.warning("⚠️  ChromeDriver connection keep-alive is disabled")
         
         # Set page load timeout to 60 seconds (instead of default 300)
         self.driver.set_page_load_timeout(60)
         
-        # Implicit wait for elements
-        self.driver.implicitly_wait(10)
+        # Async scripts (in-browser typing/scrolling with human pauses)
+        # can legitimately run for tens of seconds
+        self.driver.set_script_timeout(120)
+        
+        # No implicit wait: element waits are explicit WebDriverWaits, and a
+        # failed find_element / find_elements probe returns immediately
+        # instead of stalling for the implicit timeout
+        self.driver.implicitly_wait(0)
         
         # Execute CDP commands to hide webdriver property
         self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
@@ -112,22 +651,22 @@ class LinkedInBot:
             '''
         })
         
-        print("✅ Chrome WebDriver initialized successfully")
+        logger.info("✅ Chrome WebDriver initialized successfully")
     
     def save_cookies(self):
         """
         Save current session cookies to file
         Call this after logging in manually via Google
         """
-        print(f"💾 Saving cookies to {self.cookies_file}...")
+        logger.info(f"💾 Saving cookies to {self.cookies_file}...")
         
         cookies = self.driver.get_cookies()
         
         with open(self.cookies_file, 'w') as f:
-            json.dump(cookies, f, indent=2)
+            json.dump(cookies, f)
         
-        print(f"✅ Saved {len(cookies)} cookies")
-        print(f"✅ Cookies saved to {self.cookies_file}")
+        logger.info(f"✅ Saved {len(cookies)} cookies")
+        logger.info(f"✅ Cookies saved to {self.cookies_file}")
         
         return True
     
@@ -135,53 +674,63 @@ class LinkedInBot:
         """
         Load cookies from file and apply to browser
         This logs us in without needing password
+        
+        Cookies go in over CDP, so no page has to be open first and no
+        reload is needed - the next page load already sends them.
         """
         if not os.path.exists(self.cookies_file):
-            print(f"❌ Cookie file not found: {self.cookies_file}")
-            print("👉 Run manual_login_and_save_cookies() first")
+            logger.error(f"❌ Cookie file not found: {self.cookies_file}")
+            logger.info("👉 Run manual_login_and_save_cookies() first")
             return False
         
-        print(f"🔄 Loading cookies from {self.cookies_file}...")
+        logger.info(f"🔄 Loading cookies from {self.cookies_file}...")
         
-        # Must visit LinkedIn first before adding cookies
-        self.driver.get('https://www.linkedin.com')
-        human_delay(2, 3)
+        # Load cookies from file (parsed once per file version)
+        cdp_cookies = list(read_cdp_cookies(self.cookies_file, os.path.getmtime(self.cookies_file)))
         
-        # Load cookies from file
-        with open(self.cookies_file, 'r') as f:
-            cookies = json.load(f)
+        logger.info(f"📥 Found {len(cdp_cookies)} cookies to load")
         
-        print(f"📥 Found {len(cookies)} cookies to load")
+        # Add every cookie to the browser in a single CDP call
+        try:
+            self.driver.execute_cdp_cmd('Network.setCookies', {'cookies': cdp_cookies})
+            loaded_count = len(cdp_cookies)
+        except Exception as e:
+            # One bad cookie rejects the whole batch - add them one by one,
+            # skipping cookies that can't be added (expired, etc.)
+            logger.warning(f"  ⚠️  Batch cookie load failed, adding one by one: {str(e)[:100]}")
+            loaded_count = 0
+            for cookie in cdp_cookies:
+                try:
+                    self.driver.execute_cdp_cmd('Network.setCookie', cookie)
+                    loaded_count += 1
+                except Exception:
+                    continue
         
-        # Add each cookie to browser
-        loaded_count = 0
-        for cookie in cookies:
-            try:
-                # Remove keys that might cause issues
-                if 'sameSite' in cookie and cookie['sameSite'] not in ['Strict', 'Lax', 'None']:
-                    cookie['sameSite'] = 'None'
-                if 'expiry' in cookie:
-                    cookie['expiry'] = int(cookie['expiry'])
-                    
-                self.driver.add_cookie(cookie)
-                loaded_count += 1
-            except Exception as e:
-                # Skip cookies that can't be added (expired, etc.)
-                continue
+        logger.info(f"✅ Loaded {loaded_count}/{len(cdp_cookies)} cookies")
         
-        print(f"✅ Loaded {loaded_count}/{len(cookies)} cookies")
+        return True
+    
+    def _session_cookie_state(self):
+        """
+        Check the browser's LinkedIn session cookie (li_at) over CDP
         
-        # Refresh page to apply cookies with timeout handling
-        print("🔄 Refreshing page to apply cookies...")
+        Returns:
+            True if li_at is set and not expired, False if it's missing or
+            expired, None if the cookies couldn't be read
+        """
         try:
-            # Use JavaScript to refresh instead of driver.refresh() to avoid timeout
-            self.driver.execute_script("window.location.reload();")
-            human_delay(3, 5)
+            cookies = self.driver.execute_cdp_cmd('Network.getAllCookies', {})['cookies']
         except Exception as e:
-            print(f"  ⚠️  Refresh warning: {str(e)[:100]}")
-            # Continue anyway - cookies might still work
+            logger.warning(f"  ⚠️  Could not read cookies: {str(e)[:50]}")
+            return None
         
-        return True
+        li_at = next((c for c in cookies if c['name'] == 'li_at' and 'linkedin.com' in c.get('domain', '')), None)
+        if li_at is None:
+            return False
+        
+        # Session cookies report expires <= 0
+        expires = li_at.get('expires', -1)
+        return expires <= 0 or expires > time.time()
     
     def check_login_status(self):
         """
@@ -191,27 +740,37 @@ class LinkedInBot:
         1. Check URL (quick check for redirects)
         2. Verify logged-in UI elements exist
         
+        If the browser's li_at session cookie can be read, it replaces the
+        UI element checks: a missing/expired cookie means logged out without
+        loading the feed at all, a live one only needs the redirect check.
+        
         Returns:
             bool: True if logged in, False otherwise
         """
         try:
-            print("🔐 Checking login status...")
+            logger.info("🔐 Checking login status...")
+            
+            session_cookie = self._session_cookie_state()
+            if session_cookie is False:
+                logger.error("❌ No valid li_at session cookie - not logged in")
+                self.logged_in = False
+                return False
             
             # Step 1: Navigate to feed with timeout handling
-            print("📍 Navigating to LinkedIn feed...")
+            logger.info("📍 Navigating to LinkedIn feed...")
             
             try:
                 self.driver.get('https://www.linkedin.com/feed')
             except Exception as e:
                 # Page load timeout - check if we can still interact
                 if 'timeout' in str(e).lower():
-                    print("⚠️  Page load timed out, checking if page is usable...")
+                    logger.warning("⚠️  Page load timed out, checking if page is usable...")
                     try:
                         # Check if page loaded enough to be usable
                         current_url = self.driver.current_url
-                        print(f"📍 Page partially loaded: {current_url}")
-                    except:
-                        print("❌ Page completely unresponsive")
+                        logger.info(f"📍 Page partially loaded: {current_url}")
+                    except Exception:
+                        logger.error("❌ Page completely unresponsive")
                         self.logged_in = False
                         return False
                 else:
@@ -223,38 +782,44 @@ class LinkedInBot:
             # Step 2: Check current URL (quick detection of redirects)
             try:
                 current_url = self.driver.current_url
-                print(f"📍 Current URL: {current_url}")
+                logger.info(f"📍 Current URL: {current_url}")
             except Exception as e:
-                print(f"❌ Cannot get current URL: {str(e)[:50]}")
+                logger.error(f"❌ Cannot get current URL: {str(e)[:50]}")
                 self.logged_in = False
                 return False
             
             # Check if we got redirected to login page
             if 'login' in current_url.lower() or '/uas/login' in current_url:
-                print("❌ Redirected to login page - not logged in")
+                logger.error("❌ Redirected to login page - not logged in")
                 self.logged_in = False
                 return False
             
             # Check if we're on a security checkpoint
             if 'checkpoint' in current_url.lower():
-                print("⚠️  Security checkpoint detected - manual verification needed")
-                print("   Please complete the verification in the browser window")
+                logger.warning("⚠️  Security checkpoint detected - manual verification needed")
+                logger.warning("   Please complete the verification in the browser window")
                 self.logged_in = False
                 return False
             
             # Check if we're still on an auth-related page
             if '/authwall' in current_url or '/signup' in current_url:
-                print("❌ On authentication page - not logged in")
+                logger.error("❌ On authentication page - not logged in")
                 self.logged_in = False
                 return False
             
+            # Not redirected and the session cookie is live - logged in
+            if session_cookie:
+                logger.info("  ✅ Session cookie valid and feed loaded - user is logged in!")
+                self.logged_in = True
+                return True
+            
             # Step 3: Verify we're on a logged-in page and elements are present
             # Multiple methods to verify login status
             
             # Method 1: Check for the "Me" button (profile dropdown)
             try:
-                print("  🔍 Looking for 'Me' button (profile menu)...")
-                me_button = WebDriverWait(self.driver, 10).until(
+                logger.info("  🔍 Looking for 'Me' button (profile menu)...")
+                me_button = self._wait(10).until(
                     EC.presence_of_element_located((
                         By.XPATH, 
                         "//button[contains(@class, 'global-nav__me') or contains(@aria-label, 'Me') or contains(@id, 'ember')]"
@@ -262,90 +827,90 @@ class LinkedInBot:
                 )
                 
                 if me_button and me_button.is_displayed():
-                    print("  ✅ Found 'Me' button - user is logged in!")
+                    logger.info("  ✅ Found 'Me' button - user is logged in!")
                     self.logged_in = True
                     return True
                     
             except TimeoutException:
-                print("  ⚠️  'Me' button not found, trying alternative checks...")
+                logger.warning("  ⚠️  'Me' button not found, trying alternative checks...")
             except Exception as e:
-                print(f"  ⚠️  Error checking 'Me' button: {str(e)[:50]}")
+                logger.warning(f"  ⚠️  Error checking 'Me' button: {str(e)[:50]}")
             
             # Method 2: Look for navigation bar (backup check)
             try:
-                print("  🔍 Looking for navigation bar...")
+                logger.info("  🔍 Looking for navigation bar...")
                 nav_bar = self.driver.find_element(
                     By.XPATH,
                     "//nav[contains(@class, 'global-nav')]"
                 )
                 
                 if nav_bar and nav_bar.is_displayed():
-                    print("  ✅ Found navigation bar - appears logged in!")
+                    logger.info("  ✅ Found navigation bar - appears logged in!")
                     self.logged_in = True
                     return True
                     
             except NoSuchElementException:
-                print("  ⚠️  Navigation bar not found...")
+                logger.warning("  ⚠️  Navigation bar not found...")
             except Exception as e:
-                print(f"  ⚠️  Error checking navigation: {str(e)[:50]}")
+                logger.warning(f"  ⚠️  Error checking navigation: {str(e)[:50]}")
             
             # Method 3: Check for search bar (only visible when logged in)
             try:
-                print("  🔍 Looking for search bar...")
+                logger.info("  🔍 Looking for search bar...")
                 search_bar = self.driver.find_element(
                     By.XPATH,
                     "//input[contains(@placeholder, 'Search') or contains(@aria-label, 'Search')]"
                 )
                 
                 if search_bar and search_bar.is_displayed():
-                    print("  ✅ Found search bar - user is logged in!")
+                    logger.info("  ✅ Found search bar - user is logged in!")
                     self.logged_in = True
                     return True
                     
             except NoSuchElementException:
-                print("  ⚠️  Search bar not found...")
+                logger.warning("  ⚠️  Search bar not found...")
             except Exception as e:
-                print(f"  ⚠️  Error checking search bar: {str(e)[:50]}")
+                logger.warning(f"  ⚠️  Error checking search bar: {str(e)[:50]}")
             
             # Method 4: Check if we're on feed and can see posts
             if 'feed' in current_url.lower():
                 try:
-                    print("  🔍 Checking for feed posts...")
+                    logger.info("  🔍 Checking for feed posts...")
                     feed_posts = self.driver.find_elements(
                         By.XPATH,
                         "//div[contains(@class, 'feed-shared-update-v2')]"
                     )
                     
                     if len(feed_posts) > 0:
-                        print(f"  ✅ Found {len(feed_posts)} feed posts - user is logged in!")
+                        logger.info(f"  ✅ Found {len(feed_posts)} feed posts - user is logged in!")
                         self.logged_in = True
                         return True
                         
                 except Exception as e:
-                    print(f"  ⚠️  Error checking feed posts: {str(e)[:50]}")
+                    logger.warning(f"  ⚠️  Error checking feed posts: {str(e)[:50]}")
             
             # If we got here, couldn't confirm login
-            print("❌ Could not verify login status - no logged-in elements found")
-            print(f"   Current URL: {current_url}")
-            print("   This usually means:")
-            print("   - Session expired")
-            print("   - Chrome profile doesn't have valid session")
-            print("   - Page not fully loaded")
-            print("   - Manual login required")
+            logger.error("❌ Could not verify login status - no logged-in elements found")
+            logger.error(f"   Current URL: {current_url}")
+            logger.error("   This usually means:")
+            logger.error("   - Session expired")
+            logger.error("   - Chrome profile doesn't have valid session")
+            logger.error("   - Page not fully loaded")
+            logger.error("   - Manual login required")
             
             self.logged_in = False
             return False
             
         except Exception as e:
             error_msg = str(e)
-            print(f"❌ Error checking login status: {error_msg[:100]}")
+            logger.error(f"❌ Error checking login status: {error_msg[:100]}")
             
             # Give more specific guidance based on error type
             if 'timeout' in error_msg.lower():
-                print("   💡 Timeout error suggests:")
-                print("      - Chrome profile may be corrupted")
-                print("      - Network issues preventing LinkedIn from loading")
-                print("      - Try deleting chrome_bot_profile folder and re-logging in")
+                logger.info("   💡 Timeout error suggests:")
+                logger.info("      - Chrome profile may be corrupted")
+                logger.info("      - Network issues preventing LinkedIn from loading")
+                logger.info("      - Try deleting chrome_bot_profile folder and re-logging in")
             
             self.logged_in = False
             return False
@@ -396,32 +961,31 @@ class LinkedInBot:
         
         return True
         
-    def login(self):
+    def login(self, force=False):
         """
         Log into LinkedIn using persistent Chrome profile
         
         With persistent profile, Chrome automatically loads all session data
         (cookies, local storage, etc.) so manual login is usually not needed!
+        
+        Args:
+            force: Re-check the session even if already logged in
         """
-        if self.logged_in:
-            print("✅ Already logged in")
+        if self.logged_in and not force:
+            logger.info("✅ Already logged in")
             return True
         
-        print("🔐 Checking login status...")
-        
-        # Navigate to LinkedIn
-        self.driver.get('https://www.linkedin.com/feed')
-        human_delay(3, 5)
-        
-        # Check if we're logged in (Chrome should have loaded session from profile)
+        # Check if we're logged in (Chrome should have loaded session from profile);
+        # check_login_status() does the navigation to the feed itself
         if self.check_login_status():
-            print("✅ Logged in automatically via persistent Chrome profile!")
+            self.last_login_ts = time.time()
+            logger.info("✅ Logged in automatically via persistent Chrome profile!")
             return True
         
         # If not logged in, user needs to log in manually and we'll save the session
-        print("❌ Not logged in - persistent profile doesn't have valid session")
-        print("👉 Run: bot.manual_login_and_save_cookies()")
-        print("👉 Or just browse to linkedin.com and log in manually in this browser")
+        logger.error("❌ Not logged in - persistent profile doesn't have valid session")
+        logger.info("👉 Run: bot.manual_login_and_save_cookies()")
+        logger.info("👉 Or just browse to linkedin.com and log in manually in this browser")
         return False
     
     def login_with_password(self):
@@ -430,10 +994,10 @@ class LinkedInBot:
         Only works if you have a password-enabled account
         """
         if self.logged_in:
-            print("✅ Already logged in")
+            logger.info("✅ Already logged in")
             return True
             
-        print("🔐 Logging into LinkedIn...")
+        logger.info("🔐 Logging into LinkedIn...")
         
         try:
             # Navigate to LinkedIn login page
@@ -441,7 +1005,7 @@ class LinkedInBot:
             human_delay(3, 5)
             
             # Find and fill email field
-            email_field = WebDriverWait(self.driver, 10).until(
+            email_field = self._wait(10).until(
                 EC.presence_of_element_located((By.ID, 'username'))
             )
             human_type(email_field, Config.LINKEDIN_EMAIL)
@@ -456,23 +1020,37 @@ class LinkedInBot:
             sign_in_button = self.driver.find_element(By.CSS_SELECTOR, 'button[type="submit"]')
             sign_in_button.click()
             
-            print("⏳ Waiting for login to complete...")
+            logger.info("⏳ Waiting for login to complete...")
             human_delay(5, 8)
             
             # Check if login was successful
             if 'feed' in self.driver.current_url or 'mynetwork' in self.driver.current_url:
                 self.logged_in = True
-                print("✅ Login successful!")
+                self.last_login_ts = time.time()
+                logger.info("✅ Login successful!")
                 return True
             else:
-                print("⚠️  Login may have failed or requires verification")
-                print(f"Current URL: {self.driver.current_url}")
+                logger.warning("⚠️  Login may have failed or requires verification")
+                logger.warning(f"Current URL: {self.driver.current_url}")
                 return False
                 
         except Exception as e:
-            print(f"❌ Login failed: {str(e)}")
+            logger.error(f"❌ Login failed: {str(e)}")
             return False
     
+    def _set_blocked_urls(self, patterns):
+        """
+        Make Chrome refuse requests matching the URL patterns ([] = block nothing)
+        
+        Args:
+            patterns: CDP Network.setBlockedURLs wildcard patterns
+        """
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(patterns)})
+        except Exception as e:
+            logger.warning(f"⚠️  Could not update blocked URLs: {str(e)[:50]}")
+    
     def send_connection_request(self, profile_url, message):
         """
         Send a connection request with personalized note
@@ -491,12 +1069,13 @@ class LinkedInBot:
         Returns:
             dict: Result with success status and details
         """
-        print(f"\n📤 Attempting LinkedIn outreach to: {profile_url}")
+        logger.info(f"📤 Attempting LinkedIn outreach to: {profile_url}")
+        self.action_clicked = False
         
         try:
             # Ensure we're logged in
             if not self.logged_in:
-                print("⚠️  Not logged in, attempting login...")
+                logger.warning("⚠️  Not logged in, attempting login...")
                 if not self.login():
                     return {
                         'success': False,
@@ -504,63 +1083,67 @@ class LinkedInBot:
                     }
             
             # Navigate to profile
-            print("🌐 Navigating to profile...")
+            logger.info("🌐 Navigating to profile...")
+            if Config.BLOCK_RESOURCES:
+                self._set_blocked_urls(BLOCKED_URL_PATTERNS)
             self.driver.get(profile_url)
-            human_delay(5, 8)
-            
-            # Scroll to load page content
-            scroll_slowly(self.driver, 300)
-            human_delay(3, 5)
             
-            # Wait for profile actions to be fully loaded
-            print("⏳ Waiting for page to fully load...")
+            # Wait until the profile action buttons have rendered, rather
+            # than sleeping for a worst-case page load
+            logger.info("⏳ Waiting for page to fully load...")
+            actions_bar = None
             try:
-                WebDriverWait(self.driver, 15).until(
-                    EC.presence_of_element_located((By.XPATH, "//button[contains(@class, 'pvs-profile-actions')]"))
-                )
-                human_delay(2, 3)
+                actions_bar = self._wait(15).until(EC.any_of(
+                    *(EC.presence_of_element_located(locator) for locator in PROFILE_ACTIONS_READY)
+                ))
             except TimeoutException:
-                print("  ⚠️  Page load took longer than expected, continuing anyway...")
+                logger.warning("  ⚠️  Page load took longer than expected, continuing anyway...")
+            
+            # Scroll to load page content - unless the action buttons are
+            # already on screen, which is all we need
+            if not (actions_bar and self.driver.execute_script(
+                "var r = arguments[0].getBoundingClientRect();"
+                "return r.top >= 0 && r.bottom <= window.innerHeight;", actions_bar
+            )):
+                scroll_slowly(self.driver, 300)
+            human_delay(0.5, 1.5)
             
             # STEP 1: Check what action is available
-            print("🔍 Analyzing available actions...")
+            logger.info("🔍 Analyzing available actions...")
             
-            # Print all buttons for debugging
-            try:
-                all_buttons = self.driver.find_elements(By.TAG_NAME, 'button')
-                print(f"  🐛 DEBUG: Found {len(all_buttons)} total buttons on page")
-                
-                for i, btn in enumerate(all_buttons[:20]):
-                    try:
-                        btn_text = btn.text.strip() or btn.get_attribute('aria-label') or 'No text'
-                        print(f"  🐛 Button {i+1}: '{btn_text[:50]}'")
-                    except:
-                        continue
-            except Exception as e:
-                print(f"  ⚠️  Debug info failed: {str(e)[:50]}")
+            # Print all buttons for debugging (only when debug logging is on)
+            if logger.isEnabledFor(logging.DEBUG):
+                try:
+                    total, labels = self.driver.execute_script(ELEMENT_LABELS_JS, 'button', 20)
+                    logger.debug(f"  🐛 DEBUG: Found {total} total buttons on page")
+                    for i, btn_text in enumerate(labels):
+                        logger.debug(f"  🐛 Button {i+1}: '{btn_text[:50]}'")
+                except Exception as e:
+                    logger.warning(f"  ⚠️  Debug info failed: {str(e)[:50]}")
             
             # STEP 2: FIRST check if there's already a status (pending/connected/following)
             # This prevents trying to connect when we shouldn't
-            print("  📍 STEP 1: Checking existing relationship status...")
-            status_result = self._detect_relationship_status()
+            logger.info("  📍 STEP 1: Checking existing relationship status...")
+            actions = self._classify_profile_actions()
+            status_result = self._detect_relationship_status(actions)
             if status_result:
                 # Found existing status - return it
                 return status_result
             
             # STEP 3: No existing status - try to connect
-            print("  📍 STEP 2: No existing relationship - looking for Connect option...")
-            connect_result = self._try_connect_button(message)
+            logger.info("  📍 STEP 2: No existing relationship - looking for Connect option...")
+            connect_result = self._try_connect_button(message, actions)
             if connect_result:
                 return connect_result
             
             # STEP 4: Can't connect - try to follow
-            print("  📍 STEP 3: Connect not available - trying Follow...")
-            follow_result = self._try_follow_button()
+            logger.info("  📍 STEP 3: Connect not available - trying Follow...")
+            follow_result = self._try_follow_button(actions)
             if follow_result:
                 return follow_result
             
             # STEP 5: No action available
-            print("  ❌ No action available on this profile")
+            logger.error("  ❌ No action available on this profile")
             return {
                 'success': False,
                 'error': 'No action available - profile may be private or restricted',
@@ -568,108 +1151,124 @@ class LinkedInBot:
             }
                 
         except Exception as e:
-            print(f"❌ Error during outreach: {str(e)}")
+            logger.error(f"❌ Error during outreach: {str(e)}")
             return {
                 'success': False,
                 'error': str(e),
                 'profile_url': profile_url
             }
+        finally:
+            # Leave a normal-looking browser for manual use and the other actions
+            if Config.BLOCK_RESOURCES:
+                self._set_blocked_urls([])
+    
+    def _classify_profile_actions(self):
+        """
+        Scan the profile's action buttons once (see CLASSIFY_PROFILE_JS)
+        
+        Returns:
+            dict: 'pending'/'following' (button label or None), 'connected'
+            (bool), 'connect'/'more'/'follow' (_find_first_visible()-style
+            match or None) - or {} if the scan failed
+        """
+        try:
+            return self.driver.execute_script(CLASSIFY_PROFILE_JS, {
+                'pending': list(PENDING_SELECTORS),
+                'following': list(FOLLOWING_XPATHS),
+                'connected': CONNECTED_CHECK_XPATHS,
+                'visibleConnect': list(VISIBLE_CONNECT_SELECTORS),
+                'more': list(MORE_BUTTON_XPATHS),
+                'follow': list(FOLLOW_SELECTORS),
+            }) or {}
+        except Exception as e:
+            logger.warning(f"    ⚠️  Error scanning profile actions: {str(e)[:100]}")
+            return {}
     
-    def _detect_relationship_status(self):
+    def _detect_relationship_status(self, actions):
         """
         Detect if there's already a relationship with this person
         
+        Args:
+            actions: Result of _classify_profile_actions()
+        
         Returns:
             dict if status found (pending/connected/following), None if no status
         """
-        try:
-            # Check for PENDING connection request
-            print("    🔍 Checking for Pending status...")
-            pending_selectors = [
-                "//button[contains(., 'Pending') or contains(@aria-label, 'Pending')]",
-                "//button[contains(@aria-label, 'withdraw')]",
-            ]
-            
-            for selector in pending_selectors:
-                try:
-                    elements = self.driver.find_elements(By.XPATH, selector)
-                    for element in elements:
-                        if element.is_displayed():
-                            element_text = element.text or element.get_attribute('aria-label') or ''
-                            print(f"    ✅ FOUND: Connection request already PENDING")
-                            print(f"    📝 Element text: '{element_text[:100]}'")
-                            
-                            return {
-                                'success': True,
-                                'action_taken': 'already_pending',
-                                'message': 'Connection request already pending',
-                                'profile_url': self.driver.current_url,
-                                'skip_reason': 'Connection request already sent and pending'
-                            }
-                except:
-                    continue
-            
-            # Check for ALREADY CONNECTED
-            print("    🔍 Checking for Already Connected status...")
-            # If Message button exists but NO Connect/Follow/Pending, they're connected
-            try:
-                message_btn = self.driver.find_elements(By.XPATH, "//button[normalize-space(.)='Message']")
-                connect_btn = self.driver.find_elements(By.XPATH, "//button[normalize-space(.)='Connect']")
-                follow_btn = self.driver.find_elements(By.XPATH, "//button[normalize-space(.)='Follow' or normalize-space(.)='Following']")
-                pending_btn = self.driver.find_elements(By.XPATH, "//button[contains(., 'Pending')]")
-                
-                has_message = any(btn.is_displayed() for btn in message_btn)
-                has_connect = any(btn.is_displayed() for btn in connect_btn)
-                has_follow = any(btn.is_displayed() for btn in follow_btn)
-                has_pending = any(btn.is_displayed() for btn in pending_btn)
-                
-                if has_message and not has_connect and not has_follow and not has_pending:
-                    print(f"    ✅ FOUND: Already CONNECTED (Message only, no Connect/Follow/Pending)")
-                    
-                    return {
-                        'success': True,
-                        'action_taken': 'already_connected',
-                        'message': 'Already connected to this person',
-                        'profile_url': self.driver.current_url,
-                        'skip_reason': 'Already in network'
-                    }
-            except:
-                pass
+        # Check for PENDING connection request
+        if actions.get('pending') is not None:
+            logger.info(f"    ✅ FOUND: Connection request already PENDING")
+            logger.info(f"    📝 Element text: '{actions['pending'][:100]}'")
             
-            # Check for FOLLOWING
-            print("    🔍 Checking for Following status...")
-            following_selectors = [
-                "//button[contains(., 'Following') or contains(@aria-label, 'Following')]",
-            ]
+            return {
+                'success': True,
+                'action_taken': 'already_pending',
+                'message': 'Connection request already pending',
+                'profile_url': self.driver.current_url,
+                'skip_reason': 'Connection request already sent and pending'
+            }
+        
+        # Check for ALREADY CONNECTED
+        # If Message button exists but NO Connect/Follow/Pending, they're connected
+        if actions.get('connected'):
+            logger.info(f"    ✅ FOUND: Already CONNECTED (Message only, no Connect/Follow/Pending)")
             
-            for selector in following_selectors:
-                try:
-                    elements = self.driver.find_elements(By.XPATH, selector)
-                    for element in elements:
-                        if element.is_displayed():
-                            element_text = element.text or element.get_attribute('aria-label') or ''
-                            print(f"    ✅ FOUND: Already FOLLOWING this person")
-                            print(f"    📝 Element text: '{element_text[:100]}'")
-                            
-                            return {
-                                'success': True,
-                                'action_taken': 'already_following',
-                                'message': 'Already following this person',
-                                'profile_url': self.driver.current_url,
-                                'skip_reason': 'Already following (creator/influencer profile)'
-                            }
-                except:
-                    continue
+            return {
+                'success': True,
+                'action_taken': 'already_connected',
+                'message': 'Already connected to this person',
+                'profile_url': self.driver.current_url,
+                'skip_reason': 'Already in network'
+            }
+        
+        # Check for FOLLOWING
+        if actions.get('following') is not None:
+            logger.info(f"    ✅ FOUND: Already FOLLOWING this person")
+            logger.info(f"    📝 Element text: '{actions['following'][:100]}'")
             
-            # No status found
-            print("    ℹ️  No existing relationship status detected")
-            return None
+            return {
+                'success': True,
+                'action_taken': 'already_following',
+                'message': 'Already following this person',
+                'profile_url': self.driver.current_url,
+                'skip_reason': 'Already following (creator/influencer profile)'
+            }
+        
+        # No status found
+        logger.info("    ℹ️  No existing relationship status detected")
+        return None
+    
+    def _find_first_visible(self, selectors, timeout=0, max_x=None, max_y=None, exclude_text=None):
+        """
+        Find the first usable element matched by a list of selectors
+        
+        All selectors are evaluated inside the browser in a single
+        execute_script, instead of one WebDriver command (and one wait)
+        per selector.
+        
+        Args:
+            selectors: XPath or CSS selectors, in order of preference
+            timeout: Seconds to keep polling for a match (0 = probe once)
+            max_x: Skip elements further right than this (page px)
+            max_y: Skip elements further down than this (page px)
+            exclude_text: Skip elements whose text/aria-label contains this (lowercase)
             
-        except Exception as e:
-            print(f"    ⚠️  Error detecting status: {str(e)[:100]}")
+        Returns:
+            dict: {'element': WebElement, 'index': selector index}, or None
+        """
+        def probe(driver):
+            return driver.execute_script(
+                FIND_FIRST_VISIBLE_JS, list(selectors), max_x, max_y, exclude_text
+            )
+        
+        if not timeout:
+            return probe(self.driver)
+        
+        try:
+            return self._wait(timeout).until(probe)
+        except TimeoutException:
             return None
     
-    def _try_connect_button(self, message):
+    def _try_connect_button(self, message, actions):
         """
         Try to click Connect button
         LinkedIn shows Connect in two places:
@@ -677,328 +1276,178 @@ class LinkedInBot:
         2. Hidden inside "More" dropdown (Pattern B)
         
         Status has already been checked by caller - this only looks for Connect button
+        
+        Args:
+            message: Personalized connection message
+            actions: Result of _classify_profile_actions()
         """
         try:
-            print("  🔎 Looking for 'Connect' option...")
+            logger.info("  🔎 Looking for 'Connect' option...")
             
             # STEP 1: Check for VISIBLE Connect button first (Pattern A)
-            print("    📍 Trying visible Connect button...")
-            visible_connect = self._try_visible_connect_button(message)
+            logger.info("    📍 Trying visible Connect button...")
+            visible_connect = self._try_visible_connect_button(message, actions)
             if visible_connect:
                 return visible_connect
             
             # STEP 2: Try More dropdown (Pattern B)
-            print("    📍 Trying More dropdown...")
-            dropdown_connect = self._try_connect_in_dropdown(message)
+            logger.info("    📍 Trying More dropdown...")
+            dropdown_connect = self._try_connect_in_dropdown(message, actions)
             if dropdown_connect:
                 return dropdown_connect
             
             # No Connect option found anywhere
-            print("    ❌ Connect option not found (visible or in dropdown)")
+            logger.error("    ❌ Connect option not found (visible or in dropdown)")
             return None
                 
         except Exception as e:
-            print(f"  ❌ Error with Connect button: {str(e)}")
+            logger.error(f"  ❌ Error with Connect button: {str(e)}")
             return None
     
-    def _try_visible_connect_button(self, message):
+    def _try_visible_connect_button(self, message, actions):
         """
         Check for Connect button that's directly visible on the TARGET profile
         
         Strategy: Use simple selectors, then filter by position to avoid sidebar
         """
         try:
-            print("  📍 Step 1: Checking for visible Connect button ON TARGET PROFILE...")
-            
-            # SIMPLE selectors that find ANY Connect button, then we filter by position
-            visible_connect_selectors = [
-                # Simple text match - finds all Connect buttons
-                "//button[normalize-space(.)='Connect']",
-                
-                # Aria label version
-                "//button[contains(@aria-label, 'Invite') and contains(@aria-label, 'to connect')]",
+            logger.info("  📍 Step 1: Checking for visible Connect button ON TARGET PROFILE...")
+            
+            # Only buttons in the profile header count: the TARGET profile's
+            # Connect is at the TOP of the page (y < 700px) and left of the
+            # sidebar (x < 1000px), where the "More profiles for you" Connect
+            # buttons live. The profile scan already applied that filter
+            if 'connect' in actions:
+                match = actions['connect']
+            else:
+                match = self._find_first_visible(VISIBLE_CONNECT_SELECTORS, max_x=1000, max_y=700)
+            
+            if match:
+                connect_btn = match['element']
+                logger.info(f"  ✅ Found VISIBLE Connect button on TARGET PROFILE (selector {match['index'] + 1})!")
+                logger.info(f"  🖱️  Clicking Connect button...")
+                self.action_clicked = True
+                connect_btn.click()
+                self._wait_for_invite_modal()
                 
-                # With span child
-                "//button[.//span[normalize-space()='Connect']]",
+                # Track whether message was actually sent
+                message_actually_sent = False
+                note_add_method = None
                 
-                # Connect button that's a sibling of Message
-                "//button[normalize-space(.)='Message']/following-sibling::button[normalize-space(.)='Connect']",
-            ]
-            
-            # Try each selector
-            for i, selector in enumerate(visible_connect_selectors):
-                try:
-                    print(f"  🔍 Trying visible Connect selector {i+1}/{len(visible_connect_selectors)}...")
+                # Try to add personalized note
+                if message and len(message.strip()) > 0:
+                    note_result = self._add_connection_note(message)
                     
-                    # Find all matching buttons
-                    potential_buttons = self.driver.find_elements(By.XPATH, selector)
-                    
-                    print(f"    🐛 Found {len(potential_buttons)} potential Connect buttons with this selector")
-                    
-                    if len(potential_buttons) == 0:
-                        continue
-                    
-                    # NOW FILTER BY POSITION - this is the KEY part!
-                    connect_btn = None
-                    for btn_idx, btn in enumerate(potential_buttons):
-                        try:
-                            # Check if button is displayed
-                            if not btn.is_displayed():
-                                print(f"    ⚠️  Button {btn_idx+1} not displayed, skipping...")
-                                continue
-                            
-                            # Get button info for debugging
-                            btn_text = btn.text or btn.get_attribute('aria-label') or 'No text'
-                            
-                            # Get button position
-                            location = btn.location
-                            y_position = location['y']
-                            x_position = location['x']
-                            
-                            print(f"    🐛 Button {btn_idx+1}: text='{btn_text}', position: x={x_position}, y={y_position}")
-                            
-                            # CRITICAL FILTER: Profile Connect buttons are at TOP of page
-                            # Sidebar "More profiles for you" buttons are LOWER
-                            
-                            # Profile header is typically y < 600px
-                            # But let's be generous and allow up to y < 700px
-                            if y_position > 700:
-                                print(f"    ⚠️  Button too far down (y={y_position}), likely sidebar - SKIPPING")
-                                continue
-                            
-                            # Also check it's not too far right (sidebar is on right side)
-                            # Profile buttons are typically x < 800px
-                            if x_position > 1000:
-                                print(f"    ⚠️  Button too far right (x={x_position}), likely sidebar - SKIPPING")
-                                continue
-                            
-                            # Found a good candidate!
-                            connect_btn = btn
-                            print(f"    ✅ Found VALID Connect button at position x={x_position}, y={y_position}")
-                            break
-                            
-                        except Exception as e:
-                            print(f"    ⚠️  Error checking button {btn_idx+1}: {str(e)[:50]}")
-                            continue
-                    
-                    if not connect_btn:
-                        print(f"    ❌ No valid Connect button after position filtering")
-                        continue
-                    
-                    # Found the right button! Click it!
-                    print(f"  ✅ Found VISIBLE Connect button on TARGET PROFILE!")
-                    print(f"  🖱️  Clicking Connect button...")
-                    connect_btn.click()
-                    human_delay(2, 3)
-                    
-                    # Track whether message was actually sent
-                    message_actually_sent = False
-                    note_add_method = None
-                    
-                    # Try to add personalized note
-                    if message and len(message.strip()) > 0:
-                        note_result = self._add_connection_note(message)
-                        
-                        if note_result['success']:
-                            print(f"  ✅ Added personalized note (method: {note_result['method']})")
-                            message_actually_sent = True
-                            note_add_method = note_result['method']
-                        else:
-                            print(f"  ⚠️  Failed to add note: {note_result['error']}")
-                            print("  ⚠️  Sending connection request WITHOUT personalized message")
-                            message_actually_sent = False
+                    if note_result['success']:
+                        logger.info(f"  ✅ Added personalized note (method: {note_result['method']})")
+                        message_actually_sent = True
+                        note_add_method = note_result['method']
                     else:
-                        print("  ℹ️  No message provided, sending connection without note")
-                    
-                    # Click Send button (pass whether note was added)
-                    if self._click_send_button(note_was_added=message_actually_sent):
-                        print("✅ Connection request sent successfully!")
-                        return {
-                            'success': True,
-                            'action_taken': 'connection_request',
-                            'profile_url': self.driver.current_url,
-                            'message_sent': message_actually_sent,
-                            'note_method': note_add_method,
-                            'message_provided': bool(message and len(message.strip()) > 0)
-                        }
-                    
-                except TimeoutException:
-                    print(f"  ❌ Selector {i+1} timed out")
-                    continue
-                except Exception as e:
-                    print(f"  ⚠️  Selector {i+1} error: {str(e)[:100]}")
-                    continue
+                        logger.warning(f"  ⚠️  Failed to add note: {note_result['error']}")
+                        logger.warning("  ⚠️  Sending connection request WITHOUT personalized message")
+                        message_actually_sent = False
+                else:
+                    logger.info("  ℹ️  No message provided, sending connection without note")
+                
+                # Click Send button (pass whether note was added)
+                if self._click_send_button(note_was_added=message_actually_sent):
+                    logger.info("✅ Connection request sent successfully!")
+                    return {
+                        'success': True,
+                        'action_taken': 'connection_request',
+                        'profile_url': self.driver.current_url,
+                        'message_sent': message_actually_sent,
+                        'note_method': note_add_method,
+                        'message_provided': bool(message and len(message.strip()) > 0)
+                    }
+                
+                logger.error("  ❌ Could not send after clicking visible Connect")
+                return None
             
-            print("  ℹ️  No visible Connect button found on target profile")
-            print("  💡 This usually means:")
-            print("     - Connect is in the More dropdown (will try that next)")
-            print("     - Already connected to this person")
-            print("     - This is a creator/influencer (Follow only)")
+            logger.info("  ℹ️  No visible Connect button found on target profile")
+            logger.info("  💡 This usually means:")
+            logger.info("     - Connect is in the More dropdown (will try that next)")
+            logger.info("     - Already connected to this person")
+            logger.info("     - This is a creator/influencer (Follow only)")
             return None
             
         except Exception as e:
-            print(f"  ❌ Error checking visible Connect: {str(e)[:100]}")
+            logger.error(f"  ❌ Error checking visible Connect: {str(e)[:100]}")
             return None
     
-    def _try_connect_in_dropdown(self, message):
+    def _try_connect_in_dropdown(self, message, actions):
         """Check for Connect option inside More dropdown"""
         try:
             more_button = None  # Initialize
             
-            # CRITICAL: We want the "More" button in the PROFILE ACTIONS area
-            # NOT the "More actions" button in the top navigation bar!
-            # Profile actions are usually in a section with Message/Follow buttons
-            more_selectors = [
-                # Simple: just find the More button in main content (not navigation)
-                "//main//button[normalize-space(.)='More']",
-                # Try finding it near Message/Follow buttons (profile actions)
-                "//section[contains(@class, 'pv-top-card')]//button[normalize-space(.)='More']",
-                # Look for More button that's AFTER Message button (in same container)
-                "//button[contains(., 'Message')]/following-sibling::button[contains(., 'More')]",
-                # More specific: Find Message button, go to parent, find More
-                "//button[contains(@aria-label, 'Message')]/parent::*/button[contains(., 'More')]",
-                # Last resort: any button with just text "More"
-                "//button[text()='More' or .//span[text()='More']]",
-            ]
-            
-            for i, selector in enumerate(more_selectors):
-                try:
-                    print(f"  🔍 Trying selector {i+1}/{len(more_selectors)}: {selector[:60]}...")
-                    
-                    # Wait for element to be clickable
-                    potential_buttons = WebDriverWait(self.driver, 5).until(
-                        EC.presence_of_all_elements_located((By.XPATH, selector))
-                    )
-                    
-                    print(f"  🐛 Found {len(potential_buttons)} potential More buttons")
-                    
-                    # Filter to find the right one
-                    for btn in potential_buttons:
-                        try:
-                            button_text = btn.text or btn.get_attribute('aria-label') or ''
-                            print(f"  🐛 Checking button: '{button_text}'")
-                            
-                            # Skip if it's the navigation "More actions" button
-                            if 'actions' in button_text.lower():
-                                print(f"  ⚠️  Skipping navigation button")
-                                continue
-                            
-                            # This looks like the profile More button!
-                            if 'More' in button_text or 'more' in button_text.lower():
-                                # Make sure it's clickable
-                                if btn.is_displayed() and btn.is_enabled():
-                                    more_button = btn
-                                    print(f"  ✅ Found correct 'More' button: '{button_text}'")
-                                    break
-                        except Exception as e:
-                            print(f"  ⚠️  Error checking button: {str(e)[:30]}")
-                            continue
-                    
-                    if more_button:
-                        break
-                        
-                except TimeoutException:
-                    print(f"  ❌ Selector {i+1} timed out")
-                    continue
-                except Exception as e:
-                    print(f"  ❌ Selector {i+1} error: {str(e)[:50]}")
-                    continue
+            # Use the More button from the profile scan; if it wasn't there
+            # yet, poll all selectors in one probe (skipping the navigation
+            # "More actions" button)
+            match = actions.get('more')
+            if not match:
+                logger.info(f"  🔍 Trying {len(MORE_BUTTON_XPATHS)} More-button selectors...")
+                match = self._find_first_visible(MORE_BUTTON_XPATHS, timeout=5, exclude_text='actions')
+            if match:
+                more_button = match['element']
+                logger.info(f"  ✅ Found correct 'More' button (selector {match['index'] + 1})")
             
             if not more_button:
-                print("  ❌ 'More' button not found after trying all selectors")
-                print("  💡 This might mean:")
-                print("     - Page not fully loaded (wait longer)")
-                print("     - Already connected (no Connect option available)")
-                print("     - Different UI structure (LinkedIn A/B testing)")
+                logger.error("  ❌ 'More' button not found after trying all selectors")
+                logger.info("  💡 This might mean:")
+                logger.info("     - Page not fully loaded (wait longer)")
+                logger.info("     - Already connected (no Connect option available)")
+                logger.info("     - Different UI structure (LinkedIn A/B testing)")
                 return None
             
-            # Click "More" to reveal dropdown
-            print("  ✅ Found 'More' button, clicking to reveal options...")
-            
-            # Save the location of the More button we're clicking
-            more_button_location = more_button.location
-            
+            # Click "More" (native click), then wait for Connect to appear in
+            # the opened dropdown in one round-trip instead of sleeping
+            # through the animation
+            logger.info("  ✅ Found 'More' button, clicking to reveal options...")
             more_button.click()
-            human_delay(2, 4)  # Wait for dropdown animation
-            
-            # Additional wait for dropdown animation to complete
-            print("  ⏳ Waiting for dropdown to fully load...")
-            human_delay(1, 2)
-            
-            # DEBUG: Look for dropdown that appeared NEAR the More button we clicked
-            try:
-                print("  🐛 DEBUG: Checking dropdown contents...")
-                
-                # Find the dropdown that's actually visible and near our More button
-                # Use a more specific selector that gets ONLY the open dropdown
-                dropdown_items = self.driver.find_elements(
-                    By.XPATH, 
-                    "//div[contains(@class, 'artdeco-dropdown__content') and contains(@class, 'is-open')]//span"
-                )
-                
-                # If that doesn't work, try finding items in ANY currently visible dropdown menu
-                if len(dropdown_items) == 0:
-                    dropdown_items = self.driver.find_elements(
-                        By.XPATH,
-                        "//div[@role='menu' and not(contains(@style, 'display: none'))]//span"
-                    )
-                
-                print(f"  🐛 Found {len(dropdown_items)} items in open dropdown")
-                
-                # Print ALL items we find (not just first 10)
-                for i, item in enumerate(dropdown_items):
-                    try:
-                        item_text = item.text.strip()
-                        if item_text and len(item_text) > 0:
-                            print(f"  🐛 Dropdown item {i+1}: '{item_text}'")
-                    except:
-                        continue
-                        
-            except Exception as e:
-                print(f"  ⚠️  Debug failed: {str(e)[:100]}")
-            
-            # Now look for "Connect" in the dropdown
-            print("  📍 Looking for 'Connect' in dropdown menu...")
+            logger.info("  📍 Looking for 'Connect' in dropdown menu...")
             connect_option = None
+            match = self.driver.execute_async_script(
+                WAIT_MENU_OPTION_JS, more_button, list(DROPDOWN_CONNECT_XPATHS),
+                list(DROPDOWN_CONNECT_FALLBACK_XPATHS), DROPDOWN_TIMEOUT_MS
+            )
+            if match:
+                connect_option = match['element']
+                logger.info(f"  ✅ Found 'Connect' with selector #{match['index'] + 1}")
             
-            # Key insight: Look for Connect in the VISIBLE dropdown menu only
-            connect_selectors = [
-                # Look in dropdown that's currently open (has 'is-open' class)
-                "//div[contains(@class, 'artdeco-dropdown__content') and contains(@class, 'is-open')]//span[text()='Connect']",
-                "//div[contains(@class, 'artdeco-dropdown__content') and contains(@class, 'is-open')]//div[text()='Connect']",
-                # Look in any visible menu role element
-                "//div[@role='menu' and not(contains(@style, 'display: none'))]//span[text()='Connect']",
-                # Try the clickable parent
-                "//div[contains(@class, 'artdeco-dropdown__content') and contains(@class, 'is-open')]//span[text()='Connect']/..",
-                # Try even broader - any currently visible dropdown
-                "//div[contains(@class, 'artdeco-dropdown') and not(contains(@class, 'ember-view'))]//span[text()='Connect']",
-                # Last resort: just find any Connect that's visible
-                "//span[text()='Connect' and not(ancestor::*[contains(@style, 'display: none')])]",
-            ]
-            
-            for i, selector in enumerate(connect_selectors):
+            # DEBUG: List the items of the dropdown that just opened
+            if logger.isEnabledFor(logging.DEBUG):
                 try:
-                    print(f"  🔍 Trying Connect selector {i+1}/{len(connect_selectors)}...")
-                    connect_option = WebDriverWait(self.driver, 5).until(
-                        EC.element_to_be_clickable((By.XPATH, selector))
+                    logger.debug("  🐛 DEBUG: Checking dropdown contents...")
+                    
+                    # Only the open dropdown; fall back to any visible menu
+                    total, labels = self.driver.execute_script(
+                        ELEMENT_LABELS_JS, 'div.artdeco-dropdown__content.is-open span', 100
                     )
-                    if connect_option:
-                        print(f"  ✅ Found 'Connect' with selector #{i+1}")
-                        break
-                except TimeoutException:
-                    print(f"  ❌ Selector {i+1} failed")
-                    continue
+                    if total == 0:
+                        total, labels = self.driver.execute_script(
+                            ELEMENT_LABELS_JS, 'div[role="menu"]:not([style*="display: none"]) span', 100
+                        )
+                    
+                    logger.debug(f"  🐛 Found {total} items in open dropdown")
+                    for i, item_text in enumerate(labels):
+                        logger.debug(f"  🐛 Dropdown item {i+1}: '{item_text}'")
+                        
+                except Exception as e:
+                    logger.warning(f"  ⚠️  Debug failed: {str(e)[:100]}")
             
             if not connect_option:
-                print("  ❌ 'Connect' option not found in dropdown")
+                logger.error("  ❌ 'Connect' option not found in dropdown")
                 # Close the dropdown by pressing Escape
-                from selenium.webdriver.common.keys import Keys
                 self.driver.find_element(By.TAG_NAME, 'body').send_keys(Keys.ESCAPE)
                 return None
             
-            print("  ✅ Found 'Connect' option, clicking...")
+            if Config.HUMAN_LIKE:
+                human_delay(0.5, 1.5)
+            
+            logger.info("  ✅ Found 'Connect' option, clicking...")
+            self.action_clicked = True
             connect_option.click()
-            human_delay(2, 3)
+            self._wait_for_invite_modal()
             
             # Try to add personalized note
             message_actually_sent = False
@@ -1008,19 +1457,19 @@ class LinkedInBot:
                 note_result = self._add_connection_note(message)
                 
                 if note_result['success']:
-                    print(f"  ✅ Added personalized note (method: {note_result['method']})")
+                    logger.info(f"  ✅ Added personalized note (method: {note_result['method']})")
                     message_actually_sent = True
                     note_add_method = note_result['method']
                 else:
-                    print(f"  ⚠️  Failed to add note: {note_result['error']}")
-                    print("  ⚠️  Sending connection request WITHOUT personalized message")
+                    logger.warning(f"  ⚠️  Failed to add note: {note_result['error']}")
+                    logger.warning("  ⚠️  Sending connection request WITHOUT personalized message")
                     message_actually_sent = False
             else:
-                print("  ℹ️  No message provided, sending connection without note")
+                logger.info("  ℹ️  No message provided, sending connection without note")
             
             # Click Send (pass whether note was added)
             if self._click_send_button(note_was_added=message_actually_sent):
-                print("✅ Connection request sent successfully!")
+                logger.info("✅ Connection request sent successfully!")
                 return {
                     'success': True,
                     'action_taken': 'connection_request',
@@ -1036,40 +1485,34 @@ class LinkedInBot:
                 }
                 
         except Exception as e:
-            print(f"  ❌ Error with Connect button: {str(e)}")
+            logger.error(f"  ❌ Error with Connect button: {str(e)}")
             return None
     
-    def _try_follow_button(self):
-        """Try to click Follow button (for creator/influencer profiles)"""
+    def _try_follow_button(self, actions):
+        """
+        Try to click Follow button (for creator/influencer profiles)
+        
+        Args:
+            actions: Result of _classify_profile_actions()
+        """
         try:
-            print("  🔎 Looking for 'Follow' button...")
+            logger.info("  🔎 Looking for 'Follow' button...")
             
-            follow_selectors = [
-                "//button[.//span[text()='Follow']]",
-                "//button[contains(@aria-label, 'Follow')]",
-                "//button[contains(., 'Follow') and not(contains(., 'Following'))]",
-            ]
-            
-            follow_button = None
-            for selector in follow_selectors:
-                try:
-                    follow_button = WebDriverWait(self.driver, 3).until(
-                        EC.element_to_be_clickable((By.XPATH, selector))
-                    )
-                    if follow_button:
-                        break
-                except TimeoutException:
-                    continue
+            # Use the Follow button from the profile scan; otherwise give all
+            # selectors one shared wait instead of 3s each
+            match = actions.get('follow') or self._find_first_visible(FOLLOW_SELECTORS, timeout=3)
+            follow_button = match['element'] if match else None
             
             if not follow_button:
-                print("  ❌ 'Follow' button not found")
+                logger.error("  ❌ 'Follow' button not found")
                 return None
             
-            print("  ✅ Found 'Follow' button, clicking...")
+            logger.info("  ✅ Found 'Follow' button, clicking...")
+            self.action_clicked = True
             follow_button.click()
             human_delay(2, 3)
             
-            print("✅ Successfully followed this profile!")
+            logger.info("✅ Successfully followed this profile!")
             return {
                 'success': True,
                 'action_taken': 'follow',
@@ -1079,9 +1522,16 @@ class LinkedInBot:
             }
                 
         except Exception as e:
-            print(f"  ❌ Error with Follow button: {str(e)}")
+            logger.error(f"  ❌ Error with Follow button: {str(e)}")
             return None
     
+    def _wait_for_invite_modal(self):
+        """Wait for the invitation modal to open after clicking Connect"""
+        if not self._find_first_visible(INVITE_MODAL_SELECTORS, timeout=5):
+            logger.warning("  ⚠️  Invitation modal didn't show up, continuing anyway...")
+        if Config.HUMAN_LIKE:
+            human_delay(0.3, 0.8)
+    
     def _add_connection_note(self, message):
         """
         Add personalized note to connection request
@@ -1095,7 +1545,7 @@ class LinkedInBot:
                 'error': str - Error message if failed
             }
         """
-        print(f"  📝 Attempting to add connection note ({len(message)} characters)...")
+        logger.info(f"  📝 Attempting to add connection note ({len(message)} characters)...")
         
         # Verify we have a valid message
         if not message or len(message.strip()) == 0:
@@ -1107,7 +1557,7 @@ class LinkedInBot:
         
         # Check message length (LinkedIn limit is 300 characters)
         if len(message) > 300:
-            print(f"  ⚠️  Message too long ({len(message)} chars), truncating to 300...")
+            logger.warning(f"  ⚠️  Message too long ({len(message)} chars), truncating to 300...")
             message = message[:297] + "..."
         
         # Strategy 1: Click "Add a note" button to expand text area
@@ -1126,7 +1576,7 @@ class LinkedInBot:
             return result
         
         # All strategies failed
-        print("  ❌ All strategies to add note failed")
+        logger.error("  ❌ All strategies to add note failed")
         return {
             'success': False,
             'method': None,
@@ -1136,28 +1586,14 @@ class LinkedInBot:
     def _strategy_click_add_note_button(self, message):
         """Strategy 1: Click 'Add a note' button"""
         try:
-            print("    🔍 Strategy 1: Looking for 'Add a note' button...")
-            
-            # Multiple selectors for the "Add a note" button
-            add_note_selectors = [
-                "//button[contains(text(), 'Add a note')]",
-                "//button[@aria-label='Add a note']",
-                "//button[contains(@class, 'add-note')]",
-                "//button[.//span[contains(text(), 'Add a note')]]",
-                "//a[contains(text(), 'Add a note')]",  # Sometimes it's a link
-            ]
+            logger.info("    🔍 Strategy 1: Looking for 'Add a note' button...")
             
+            # All selectors share one 3s wait
             add_note_button = None
-            for i, selector in enumerate(add_note_selectors):
-                try:
-                    add_note_button = WebDriverWait(self.driver, 3).until(
-                        EC.element_to_be_clickable((By.XPATH, selector))
-                    )
-                    if add_note_button and add_note_button.is_displayed():
-                        print(f"    ✅ Found 'Add a note' button (selector {i+1})")
-                        break
-                except TimeoutException:
-                    continue
+            match = self._find_first_visible(ADD_NOTE_SELECTORS, timeout=3)
+            if match:
+                add_note_button = match['element']
+                logger.info(f"    ✅ Found 'Add a note' button (selector {match['index'] + 1})")
             
             if not add_note_button:
                 return {
@@ -1167,11 +1603,10 @@ class LinkedInBot:
                 }
             
             # Click the button
-            print("    🖱️  Clicking 'Add a note' button...")
+            logger.info("    🖱️  Clicking 'Add a note' button...")
             add_note_button.click()
-            human_delay(1, 2)
             
-            # Now find and fill the text area
+            # Now find and fill the text area (waits for it to appear)
             return self._fill_message_textarea(message, 'click_add_note_button')
             
         except Exception as e:
@@ -1184,7 +1619,7 @@ class LinkedInBot:
     def _strategy_find_visible_textarea(self, message):
         """Strategy 2: Text area is already visible (no button click needed)"""
         try:
-            print("    🔍 Strategy 2: Looking for already-visible text area...")
+            logger.info("    🔍 Strategy 2: Looking for already-visible text area...")
             
             return self._fill_message_textarea(message, 'visible_textarea')
             
@@ -1198,20 +1633,17 @@ class LinkedInBot:
     def _strategy_alternative_add_note_button(self, message):
         """Strategy 3: Try clicking anywhere in the note area to expand it"""
         try:
-            print("    🔍 Strategy 3: Trying alternative expansion methods...")
+            logger.info("    🔍 Strategy 3: Trying alternative expansion methods...")
             
             # Sometimes clicking on the container expands it
-            container_selectors = [
-                "//div[contains(@class, 'send-invite')]",
-                "//div[contains(@class, 'invitation-modal')]",
-                "//div[contains(text(), 'Add a note')]",
-            ]
-            
-            for selector in container_selectors:
+            for selector in NOTE_CONTAINER_SELECTORS:
                 try:
-                    container = self.driver.find_element(By.XPATH, selector)
-                    if container and container.is_displayed():
-                        print(f"    🖱️  Clicking container to expand...")
+                    containers = self.driver.find_elements(*selector_locator(selector))
+                    if not containers:
+                        continue
+                    container = containers[0]
+                    if container.is_displayed():
+                        logger.info(f"    🖱️  Clicking container to expand...")
                         container.click()
                         human_delay(1, 2)
                         
@@ -1219,7 +1651,7 @@ class LinkedInBot:
                         result = self._fill_message_textarea(message, 'alternative_click')
                         if result['success']:
                             return result
-                except:
+                except Exception:
                     continue
             
             return {
@@ -1247,32 +1679,17 @@ class LinkedInBot:
             dict with success status
         """
         try:
-            print("    📝 Looking for message text area...")
-            
-            # Multiple selectors for the textarea
-            textarea_selectors = [
-                "//textarea[@id='custom-message']",
-                "//textarea[@name='message']",
-                "//textarea[contains(@placeholder, 'Add a note')]",
-                "//textarea[contains(@class, 'send-invite__custom-message')]",
-                "//textarea[contains(@aria-label, 'Add a note')]",
-                "//div[@role='textbox']",  # Sometimes it's a contenteditable div
-            ]
+            logger.info("    📝 Looking for message text area...")
             
+            # All selectors share one 3s wait
             message_field = None
-            for i, selector in enumerate(textarea_selectors):
-                try:
-                    message_field = WebDriverWait(self.driver, 3).until(
-                        EC.presence_of_element_located((By.XPATH, selector))
-                    )
-                    if message_field and message_field.is_displayed():
-                        print(f"    ✅ Found text area (selector {i+1})")
-                        break
-                except TimeoutException:
-                    continue
+            match = self._find_first_visible(NOTE_TEXTAREA_SELECTORS, timeout=3)
+            if match:
+                message_field = match['element']
+                logger.info(f"    ✅ Found text area (selector {match['index'] + 1})")
             
             if not message_field:
-                print("    ❌ Could not find message text area")
+                logger.error("    ❌ Could not find message text area")
                 return {
                     'success': False,
                     'method': method_name,
@@ -1280,14 +1697,20 @@ class LinkedInBot:
                 }
             
             # Clear any existing text
-            print("    🧹 Clearing text area...")
+            logger.info("    🧹 Clearing text area...")
             message_field.clear()
-            human_delay(0.3, 0.7)
             
-            # Type the message using human-like typing
-            print(f"    ⌨️  Typing message ({len(message)} characters)...")
-            human_type(message_field, message)
-            human_delay(1, 2)
+            if Config.HUMAN_LIKE:
+                # Type the message using human-like typing
+                logger.info(f"    ⌨️  Typing message ({len(message)} characters)...")
+                human_type(message_field, message)
+                human_delay(0.3, 0.8)
+            else:
+                # Insert it in one call; a real keypress afterwards makes sure
+                # the modal's key handlers see the change (enables Send)
+                logger.info(f"    ⌨️  Inserting message ({len(message)} characters)...")
+                self.driver.execute_script(SET_NOTE_TEXT_JS, message_field, message)
+                message_field.send_keys(' ', Keys.BACK_SPACE)
             
             # Verify the message was typed correctly
             typed_text = message_field.get_attribute('value')
@@ -1296,9 +1719,9 @@ class LinkedInBot:
                 typed_text = message_field.text
             
             if len(typed_text) < len(message) * 0.9:  # Allow 10% variance
-                print(f"    ⚠️  Warning: Only {len(typed_text)}/{len(message)} characters typed")
+                logger.warning(f"    ⚠️  Warning: Only {len(typed_text)}/{len(message)} characters typed")
             
-            print(f"    ✅ Successfully typed {len(typed_text)} characters")
+            logger.info(f"    ✅ Successfully typed {len(typed_text)} characters")
             
             return {
                 'success': True,
@@ -1308,7 +1731,7 @@ class LinkedInBot:
             
         except Exception as e:
             error_msg = str(e)[:100]
-            print(f"    ❌ Error filling textarea: {error_msg}")
+            logger.error(f"    ❌ Error filling textarea: {error_msg}")
             return {
                 'success': False,
                 'method': method_name,
@@ -1326,89 +1749,64 @@ class LinkedInBot:
             bool: True if successfully clicked Send, False otherwise
         """
         try:
-            print("    📤 Looking for Send button...")
+            logger.info("    📤 Looking for Send button...")
             
             # If note was added, look for regular "Send" button
             # If note was NOT added, we might need to click "Send without a note"
-            if note_was_added:
-                send_selectors = [
-                    "//button[contains(@aria-label, 'Send') and not(contains(@aria-label, 'without'))]",
-                    "//button[@aria-label='Send invitation']",
-                    "//button[.//span[text()='Send']]",
-                    "//button[contains(., 'Send now')]",
-                    "//button[text()='Send']",
-                ]
-            else:
-                # When no note, we might see "Send without a note" OR just "Send"
-                send_selectors = [
-                    "//button[contains(., 'Send without a note')]",
-                    "//button[contains(@aria-label, 'Send without')]",
-                    "//button[.//span[contains(text(), 'Send')]]",
-                    "//button[contains(@aria-label, 'Send')]",
-                    "//button[text()='Send']",
-                ]
+            send_selectors = SEND_WITH_NOTE_SELECTORS if note_was_added else SEND_WITHOUT_NOTE_SELECTORS
             
+            # All selectors share one 5s wait; each poll still prefers
+            # them in order (an XPath union would return document order)
             send_button = None
-            successful_selector = None
-            
-            for i, selector in enumerate(send_selectors):
-                try:
-                    send_button = WebDriverWait(self.driver, 5).until(
-                        EC.element_to_be_clickable((By.XPATH, selector))
-                    )
-                    if send_button and send_button.is_displayed():
-                        successful_selector = i + 1
-                        print(f"    ✅ Found Send button (selector {successful_selector})")
-                        break
-                except TimeoutException:
-                    continue
+            match = self._find_first_visible(send_selectors, timeout=5)
+            if match:
+                send_button = match['element']
+                logger.info(f"    ✅ Found Send button (selector {match['index'] + 1})")
             
             if not send_button:
-                print("    ❌ Could not find Send button")
-                print("    💡 Possible reasons:")
-                print("       - Connection limit reached")
-                print("       - Modal closed unexpectedly")
-                print("       - Page changed")
+                logger.error("    ❌ Could not find Send button")
+                logger.info("    💡 Possible reasons:")
+                logger.info("       - Connection limit reached")
+                logger.info("       - Modal closed unexpectedly")
+                logger.info("       - Page changed")
                 return False
             
             # Get button text for logging
             button_text = send_button.text or send_button.get_attribute('aria-label') or 'Send'
-            print(f"    🖱️  Clicking '{button_text}' button...")
+            logger.info(f"    🖱️  Clicking '{button_text}' button...")
             
             send_button.click()
-            human_delay(2, 4)
             
             # Verify the modal closed (successful send)
             try:
-                # Check if the invitation modal is still visible
-                modal = self.driver.find_element(
-                    By.XPATH,
-                    "//div[contains(@class, 'send-invite') or contains(@class, 'artdeco-modal')]"
-                )
-                if modal and modal.is_displayed():
-                    print("    ⚠️  Warning: Modal still visible after clicking Send")
-                    # Give it more time
-                    human_delay(2, 3)
-            except:
-                # Modal not found = good! It closed
-                pass
-            
-            print("    ✅ Send button clicked successfully")
+                self._wait(5).until(lambda driver: not self._find_first_visible(INVITE_MODAL_SELECTORS))
+            except TimeoutException:
+                logger.warning("    ⚠️  Warning: Modal still visible after clicking Send")
+            
+            logger.info("    ✅ Send button clicked successfully")
             return True
             
         except Exception as e:
             error_msg = str(e)[:100]
-            print(f"    ❌ Error clicking Send: {error_msg}")
+            logger.error(f"    ❌ Error clicking Send: {error_msg}")
             return False
             
         except Exception as e:
-            print(f"    ❌ Error clicking Send: {str(e)}")
+            logger.error(f"    ❌ Error clicking Send: {str(e)}")
             return False
     
     def close(self):
         """Close the browser"""
         if self.driver:
-            print("🔒 Closing browser...")
-            self.driver.quit()
-            self.logged_in = False
-            print("✅ Browser closed")
\ No newline at end of file
+            logger.info("🔒 Closing browser...")
+            try:
+                # Raises on a dead session for a reattached driver
+                self.driver.quit()
+            finally:
+                if self._service:
+                    self._service.stop()
+                # A quit session can't be reattached
+                if os.path.exists(self.session_file):
+                    os.remove(self.session_file)
+                self.logged_in = False
+            logger.info("✅ Browser closed")
\ No newline at end of file
@@ -11,8 +11,12 @@ After that: Bot uses saved cookies automatically!
 
 from linkedin_bot import LinkedInBot
 from config import Config
+import logging
 import os
 
+# Show the bot's progress log on the console
+logging.basicConfig(level=logging.INFO, format='%(message)s')
+
 def setup_cookies():
     """
     ONE-TIME SETUP: Log in once, Chrome profile remembers forever